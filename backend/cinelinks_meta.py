@@ -1,9 +1,17 @@
 import sys, json, urllib.request
 
+try:  # optional fast JSON decoder
+    import orjson
+except ImportError:
+    orjson = None
+
 def fetch_meta(base_url: str):
     url = f"{base_url.rstrip('/')}/meta"
-    with urllib.request.urlopen(url) as resp:
-        return json.loads(resp.read().decode("utf-8"))
+    with urllib.request.urlopen(url, timeout=10) as resp:
+        if orjson is not None:
+            return orjson.loads(resp.read())
+        # json.load streams from the socket, skipping the intermediate bytes blob
+        return json.load(resp)
 
 def print_meta(tag, meta):
     print(f"\n[{tag}]")
@@ -14,12 +22,17 @@ def print_meta(tag, meta):
     print(f" checksum: {meta.get('checksum')}")
 
 def compare(a, b):
-    keys = ["actors", "movies", "edges", "checksum"]
-    mismatches = [k for k in keys if a.get(k) != b.get(k)]
+    mismatches = {
+        k: (a.get(k), b.get(k))
+        for k in ("actors", "movies", "edges", "checksum")
+        if a.get(k) != b.get(k)
+    }
     if not mismatches:
         print("\n✅ MATCH: datasets are identical.")
         return 0
-    print("\n❌ MISMATCH in:", ", ".join(mismatches))
+    print("\n❌ MISMATCH in:")
+    for k, (va, vb) in mismatches.items():
+        print(f"  {k}: {va} != {vb}")
     return 1
 
 if __name__ == "__main__":
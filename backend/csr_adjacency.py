@@ -0,0 +1,163 @@
+"""
+Compact CSR adjacency for the actor-actor graph.
+
+NetworkX stores adjacency as nested Python dicts (~hundreds of bytes per
+edge, heavy pointer chasing). For hot read-only queries — edge tests,
+neighbor iteration, BFS — a CSR (compressed sparse row) view is far more
+cache-friendly: per-node neighbor lists are contiguous int32 slices of a
+single array. The NetworkX graph stays the source of truth for all
+metadata; this is a derived, read-only structure built once at load time.
+"""
+
+from typing import Iterator, List, Optional
+
+import numpy as np
+
+
+class CSRAdjacency:
+    """
+    Read-only CSR view of an undirected NetworkX graph's adjacency.
+
+    Nodes are mapped to dense int indices; each node's neighbors are a
+    sorted, contiguous slice of `indices`, so `has_edge` is a binary
+    search and `neighbors` is a slice read.
+    """
+
+    __slots__ = ("nodes", "index_of", "indptr", "indices")
+
+    def __init__(self, graph):
+        self.nodes: List[str] = list(graph.nodes())
+        self.index_of = {n: i for i, n in enumerate(self.nodes)}
+
+        n = len(self.nodes)
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        adj = graph.adj
+        for i, node in enumerate(self.nodes):
+            indptr[i + 1] = indptr[i] + len(adj[node])
+
+        indices = np.empty(int(indptr[-1]), dtype=np.int32)
+        index_of = self.index_of
+        for i, node in enumerate(self.nodes):
+            row = sorted(index_of[nbr] for nbr in adj[node])
+            indices[indptr[i]:indptr[i + 1]] = row
+
+        self.indptr = indptr
+        self.indices = indices
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def _row(self, idx: int) -> np.ndarray:
+        return self.indices[self.indptr[idx]:self.indptr[idx + 1]]
+
+    def has_edge(self, u: str, v: str) -> bool:
+        """Edge test via binary search over the sorted neighbor row."""
+        ui = self.index_of.get(u)
+        vi = self.index_of.get(v)
+        if ui is None or vi is None:
+            return False
+        row = self._row(ui)
+        pos = int(np.searchsorted(row, vi))
+        return pos < len(row) and row[pos] == vi
+
+    def degree(self, u: str) -> int:
+        ui = self.index_of[u]
+        return int(self.indptr[ui + 1] - self.indptr[ui])
+
+    def neighbors(self, u: str) -> Iterator[str]:
+        """Iterate neighbor node IDs of u."""
+        nodes = self.nodes
+        for vi in self._row(self.index_of[u]):
+            yield nodes[vi]
+
+    def shortest_path_length(self, source: str, target: str) -> Optional[int]:
+        """
+        Unweighted shortest-path length between two nodes, or None if
+        either is missing or they are disconnected.
+
+        Level-synchronous BFS over the CSR arrays: each level gathers the
+        frontier's neighbor slices in bulk and masks visited nodes with
+        vectorized numpy ops, so the per-level work runs in compiled code
+        instead of Python-dict pointer chasing.
+        """
+        src = self.index_of.get(source)
+        dst = self.index_of.get(target)
+        if src is None or dst is None:
+            return None
+        if src == dst:
+            return 0
+
+        indptr, indices = self.indptr, self.indices
+        visited = np.zeros(len(self.nodes), dtype=bool)
+        visited[src] = True
+        frontier = np.array([src], dtype=np.int64)
+        dist = 0
+        while frontier.size:
+            dist += 1
+            neighbors = np.concatenate([indices[indptr[u]:indptr[u + 1]] for u in frontier])
+            neighbors = np.unique(neighbors[~visited[neighbors]])
+            if neighbors.size == 0:
+                return None
+            visited[neighbors] = True
+            if visited[dst]:
+                return dist
+            frontier = neighbors
+        return None
+
+    def all_shortest_paths(self, source: str, target: str, limit: Optional[int] = None) -> List[List[str]]:
+        """
+        All shortest paths between two nodes as lists of node IDs, up to
+        `limit`. Returns [] if either node is missing or no path exists.
+
+        Same level-synchronous BFS as shortest_path_length, additionally
+        recording each discovered node's predecessors in the BFS dag; the
+        search stops at the target's level and paths are then enumerated
+        backwards from the target. Only the dag bookkeeping and the final
+        path walk run in Python — frontier expansion stays in numpy.
+        """
+        src = self.index_of.get(source)
+        dst = self.index_of.get(target)
+        if src is None or dst is None:
+            return []
+        if src == dst:
+            return [[source]]
+
+        indptr, indices = self.indptr, self.indices
+        dist = np.full(len(self.nodes), -1, dtype=np.int32)
+        dist[src] = 0
+        preds: dict = {}
+        frontier = np.array([src], dtype=np.int64)
+        d = 0
+        while frontier.size:
+            d += 1
+            counts = indptr[frontier + 1] - indptr[frontier]
+            us = np.repeat(frontier, counts)
+            vs = np.concatenate([indices[indptr[u]:indptr[u + 1]] for u in frontier])
+            newly = np.unique(vs[dist[vs] == -1])
+            if newly.size == 0:
+                return []
+            dist[newly] = d
+            # BFS-dag edges into this level (a node can have several
+            # shortest predecessors, one per distinct shortest path)
+            mask = dist[vs] == d
+            for u, v in zip(us[mask].tolist(), vs[mask].tolist()):
+                preds.setdefault(v, []).append(u)
+            if dist[dst] == d:
+                break
+            frontier = newly
+        if dist[dst] == -1:
+            return []
+
+        nodes = self.nodes
+        paths: List[List[str]] = []
+        stack = [(dst, [dst])]
+        while stack:
+            v, tail = stack.pop()
+            if v == src:
+                paths.append([nodes[i] for i in reversed(tail)])
+                if limit is not None and len(paths) >= limit:
+                    break
+                continue
+            for u in preds[v]:
+                stack.append((u, tail + [u]))
+        return paths
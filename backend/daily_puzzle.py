@@ -5,16 +5,28 @@ Manages deterministic daily puzzle generation with actor reuse exclusion.
 Ensures all users get the same puzzle on the same day.
 """
 
+import atexit
+import json
 import logging
 import os
-import pickle
 import random
-from datetime import datetime, timedelta
+import threading
+from datetime import datetime
 from zoneinfo import ZoneInfo
 from typing import Tuple, Dict
 
+try:  # optional fast JSON codec for state persistence
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger("movielinks.daily_puzzle")
 
+# Persisted puzzle history is capped to a sliding window; only the
+# exclusion logic needs recent entries, and an unbounded dict makes
+# every save (and restart load) slower the longer the server lives.
+MAX_PERSISTED_PUZZLES = 90
+
 
 class DailyPuzzleManager:
     """
@@ -24,42 +36,111 @@ class DailyPuzzleManager:
     - Deterministic puzzle per day (same puzzle_id = same actors for all users)
     - 20-day exclusion window for used actors
     - Graceful fallback to 15/10/0 days if pool exhausted
-    - State persistence across server restarts via pickle
+    - State persistence across server restarts via JSON
     """
 
-    def __init__(self, graph, state_file="daily_puzzle_state.pickle"):
+    def __init__(self, graph, state_file="daily_puzzle_state.json", starting_pool=None):
         """
         Initialize the daily puzzle manager.
 
         Args:
             graph: NetworkX graph with actor nodes
-            state_file: Path to pickle file for state persistence
+            state_file: Path to JSON file for state persistence
+            starting_pool: Precomputed starting-actor node list; when the
+                caller (load_graph) has already derived it, pass it in so
+                the graph is not scanned a second time
         """
         self.graph = graph
+        # Use the caller's precomputed pool or the graph-level index when
+        # the build recorded one; otherwise scan node attributes once.
+        # Either way the pool is computed a single time instead of per
+        # puzzle generation (up to 4x across exclusion windows).
+        pool = starting_pool if starting_pool is not None else graph.graph.get("starting_pool")
+        if pool is None:
+            pool = [n for n, d in graph.nodes(data=True) if d.get('in_starting_pool', False)]
+        self._starting_pool = tuple(pool)
+        # Companion frozenset so "is this actor in the pool" is an O(1)
+        # membership test rather than a node-attribute read
+        self._starting_pool_set = frozenset(self._starting_pool)
         self.state_file = state_file
         self.state = self._load_state()
+        # Flat puzzle_id -> (start, target) cache so the hot "already
+        # generated" path is a single dict.get instead of nested lookups.
+        self._puzzle_cache = {
+            pid: (p["start_actor"], p["target_actor"])
+            for pid, p in self.state["puzzles"].items()
+        }
+        # Debounced persistence: puzzle generation only marks the state
+        # dirty; a background thread flushes it at most once per interval
+        # so a burst of requests at day rollover doesn't rewrite the file
+        # once per request. atexit covers clean shutdown.
+        self._dirty = False
+        self._state_lock = threading.Lock()
+        self._flush_interval = 30  # seconds
+        self._stop = threading.Event()
+        flusher = threading.Thread(target=self._flush_loop, daemon=True)
+        flusher.start()
+        atexit.register(self.flush)
 
     def _load_state(self) -> Dict:
         """Load puzzle state from disk or initialize new state."""
         if os.path.exists(self.state_file):
             try:
                 with open(self.state_file, "rb") as f:
-                    state = pickle.load(f)
-                    logger.info("Loaded state with %d puzzles", len(state.get('puzzles', {})))
-                    return state
+                    data = f.read()
+                state = orjson.loads(data) if orjson is not None else json.loads(data)
+                logger.info("Loaded state with %d puzzles", len(state.get('puzzles', {})))
+                return state
             except Exception as e:
                 logger.error("Failed to load state: %s, initializing fresh", e)
 
         return {"puzzles": {}, "recent_actors": {}}
 
     def _save_state(self):
-        """Persist puzzle state to disk."""
+        """Persist puzzle state to disk (write-then-rename for atomicity)."""
         try:
-            with open(self.state_file, "wb") as f:
-                pickle.dump(self.state, f)
+            # Trim history to the most recent window (puzzle ids are
+            # YYYYMMDD strings, so lexicographic sort is chronological)
+            puzzles = self.state["puzzles"]
+            if len(puzzles) > MAX_PERSISTED_PUZZLES:
+                keep = sorted(puzzles)[-MAX_PERSISTED_PUZZLES:]
+                self.state["puzzles"] = {k: puzzles[k] for k in keep}
+
+            tmp_file = self.state_file + ".tmp"
+            with open(tmp_file, "wb") as f:
+                if orjson is not None:
+                    f.write(orjson.dumps(self.state))
+                else:
+                    f.write(json.dumps(self.state).encode("utf-8"))
+            os.replace(tmp_file, self.state_file)
         except Exception as e:
             logger.error("Failed to save state: %s", e)
 
+    def flush(self):
+        """Write the state to disk now if it has pending changes."""
+        with self._state_lock:
+            if self._dirty:
+                self._save_state()
+                self._dirty = False
+
+    def _flush_loop(self):
+        """Background loop that periodically flushes dirty state."""
+        while not self._stop.wait(self._flush_interval):
+            self.flush()
+
+    def close(self):
+        """
+        Stop the background flusher, drop the atexit hook, and flush.
+
+        load_graph calls this on the outgoing manager when a new graph is
+        published; without it every reload leaked an immortal flusher
+        thread plus an atexit reference that pinned the old manager (and
+        its graph) in memory for the life of the process.
+        """
+        self._stop.set()
+        atexit.unregister(self.flush)
+        self.flush()
+
     def _cleanup_old_actors(self, cutoff_date: str):
         """
         Remove actors older than cutoff_date from recent_actors.
@@ -67,47 +148,68 @@ class DailyPuzzleManager:
         Args:
             cutoff_date: Date string in YYYYMMDD format
         """
-        original_count = len(self.state["recent_actors"])
+        recent = self.state["recent_actors"]
+        original_count = len(recent)
         self.state["recent_actors"] = {
             actor_id: used_date
-            for actor_id, used_date in self.state["recent_actors"].items()
+            for actor_id, used_date in recent.items()
             if used_date >= cutoff_date
         }
         removed = original_count - len(self.state["recent_actors"])
         if removed > 0:
             logger.info("Cleaned up %d old actor entries", removed)
 
-    def _get_available_actors(self, exclude_days: int) -> list:
+    def _get_available_actors(self, exclude_days: int, cutoff_date: str) -> list:
         """
-        Get actors not used in past N days from starting pool.
+        Get actors not used since cutoff_date from starting pool.
 
         Args:
-            exclude_days: Number of days to exclude recently used actors
+            exclude_days: Exclusion window length (for logging)
+            cutoff_date: Date string in YYYYMMDD format
 
         Returns:
             List of actor node IDs available for selection
         """
-        cutoff_date = (datetime.now() - timedelta(days=exclude_days)).strftime("%Y%m%d")
-        recent_actor_ids = set(
-            actor_id for actor_id, used_date in self.state["recent_actors"].items()
+        recent = self.state["recent_actors"]
+        recent_actor_ids = {
+            actor_id for actor_id, used_date in recent.items()
             if used_date >= cutoff_date
-        )
-
-        all_starting_actors = [
-            n for n in self.graph.nodes()
-            if self.graph.nodes[n].get('in_starting_pool', False)
-        ]
+        }
 
-        available = [a for a in all_starting_actors if a not in recent_actor_ids]
-        logger.info("Available actors (exclude %dd): %d/%d", exclude_days, len(available), len(all_starting_actors))
+        available = [a for a in self._starting_pool if a not in recent_actor_ids]
+        logger.info("Available actors (exclude %dd): %d/%d", exclude_days, len(available), len(self._starting_pool))
         return available
 
+    def precompute(self, puzzle_ids) -> Dict[str, Tuple[str, str]]:
+        """
+        Pre-generate puzzles for a range of dates (e.g. at deploy time).
+
+        Puzzle ids are processed in chronological order because each day's
+        generation depends on the recent_actors state left by earlier days
+        (the exclusion window); generating days concurrently would change
+        the puzzles users see. Already-generated days are served from
+        cache. State is flushed to disk once at the end instead of per day.
+
+        Args:
+            puzzle_ids: Iterable of date strings in YYYYMMDD format
+
+        Returns:
+            Dict of puzzle_id -> (start_actor_id, target_actor_id)
+        """
+        results = {}
+        for puzzle_id in sorted(puzzle_ids):
+            results[puzzle_id] = self.get_daily_puzzle(puzzle_id)
+        self.flush()
+        logger.info("Precomputed %d puzzles", len(results))
+        return results
+
     def _is_valid_pair(self, actor_a: str, actor_b: str) -> bool:
         """
         Check if two actors form a valid puzzle.
 
         Actors are valid if:
         - They are different actors
+        - Both are in the starting pool
         - They are not directly connected (no shared movie)
 
         Args:
@@ -119,6 +221,8 @@ class DailyPuzzleManager:
         """
         if actor_a == actor_b:
             return False
+        if actor_a not in self._starting_pool_set or actor_b not in self._starting_pool_set:
+            return False
         if self.graph.has_edge(actor_a, actor_b):
             return False
         return True
@@ -144,73 +248,103 @@ class DailyPuzzleManager:
             Tuple of (start_actor_id, target_actor_id)
         """
         # Check if puzzle already exists for this date
-        if puzzle_id in self.state["puzzles"]:
-            puzzle = self.state["puzzles"][puzzle_id]
+        cached = self._puzzle_cache.get(puzzle_id)
+        if cached:
             logger.info("Using cached puzzle for %s", puzzle_id)
-            return puzzle["start_actor"], puzzle["target_actor"]
+            return cached
 
         logger.info("Generating new puzzle for %s", puzzle_id)
 
-        # Generate new puzzle with deterministic seed
+        # Generate new puzzle with a local deterministic RNG; seeding the
+        # module-level random would race between concurrent generations
+        # and perturb unrelated callers
         puzzle_seed = int(puzzle_id)  # YYYYMMDD as integer seed
-        random.seed(puzzle_seed)
-
-        # Try with decreasing exclusion windows
-        for exclusion_days in [20, 15, 10, 0]:
-            available_actors = self._get_available_actors(exclusion_days)
-
-            if len(available_actors) < 2:
-                logger.info("Not enough actors for %d-day exclusion, trying shorter window", exclusion_days)
-                continue  # Try shorter exclusion window
-
-            # Try up to 100 random pairs to find valid combination
-            attempts = 0
-            for _ in range(100):
-                attempts += 1
-                start_actor, target_actor = random.sample(available_actors, 2)
-
-                if self._is_valid_pair(start_actor, target_actor):
-                    # Valid puzzle found - save it
-                    logger.info("Found valid pair after %d attempts (exclusion: %dd)", attempts, exclusion_days)
-
-                    self.state["puzzles"][puzzle_id] = {
-                        "start_actor": start_actor,
-                        "target_actor": target_actor,
-                        "generated_at": datetime.now().isoformat(),
-                        "exclusion_days": exclusion_days
-                    }
-                    self.state["recent_actors"][start_actor] = puzzle_id
-                    self.state["recent_actors"][target_actor] = puzzle_id
-
-                    # Cleanup old entries (keep only 25 days for safety buffer)
-                    cutoff = (datetime.now() - timedelta(days=25)).strftime("%Y%m%d")
-                    self._cleanup_old_actors(cutoff)
-
-                    self._save_state()
-
-                    # Reset random seed to restore normal randomness
-                    random.seed()
-
-                    return start_actor, target_actor
-
-        # Fallback: if no valid pair found even without exclusion, use any two
-        logger.warning("Using fallback (any pair) for %s", puzzle_id)
-        all_starting_actors = [
-            n for n in self.graph.nodes()
-            if self.graph.nodes[n].get('in_starting_pool', False)
-        ]
-        start_actor, target_actor = random.sample(all_starting_actors, 2)
-
-        self.state["puzzles"][puzzle_id] = {
-            "start_actor": start_actor,
-            "target_actor": target_actor,
-            "generated_at": datetime.now().isoformat(),
-            "exclusion_days": 0,
-            "fallback": True
+        rng = random.Random(puzzle_seed)
+
+        # Read the clock once and derive every cutoff string from today's
+        # ordinal instead of a datetime.now() + strftime per window
+        today_ord = datetime.now().toordinal()
+        cutoffs = {
+            days: datetime.fromordinal(today_ord - days).strftime("%Y%m%d")
+            for days in (20, 15, 10, 0, 25)
         }
-        self.state["recent_actors"][start_actor] = puzzle_id
-        self.state["recent_actors"][target_actor] = puzzle_id
-        self._save_state()
 
-        random.seed()  # Reset seed
-        return start_actor, target_actor
+        # Generation runs under the state lock: the debounced flusher
+        # serializes self.state while holding it, and json/orjson over a
+        # dict being mutated by another thread can raise (the trim in
+        # _save_state also rebinds state["puzzles"], which would drop a
+        # concurrently inserted puzzle from the persisted snapshot). It
+        # also means two requests racing the same day rollover generate
+        # the puzzle once instead of twice.
+        with self._state_lock:
+            cached = self._puzzle_cache.get(puzzle_id)
+            if cached:
+                return cached
+
+            # Try with decreasing exclusion windows
+            for exclusion_days in [20, 15, 10, 0]:
+                available_actors = self._get_available_actors(exclusion_days, cutoffs[exclusion_days])
+
+                if len(available_actors) < 2:
+                    logger.info("Not enough actors for %d-day exclusion, trying shorter window", exclusion_days)
+                    continue  # Try shorter exclusion window
+
+                # Pick the start uniformly, then sample the target against the
+                # start's neighborhood only. The neighborhood is tiny relative
+                # to the pool, so this finds a valid pair in O(1) expected
+                # attempts instead of rejecting up to 100 random pairs.
+                start_actor = available_actors[rng.randrange(len(available_actors))]
+                forbidden = set(self.graph.neighbors(start_actor))
+                forbidden.add(start_actor)
+
+                target_actor = None
+                for _ in range(20):
+                    candidate = available_actors[rng.randrange(len(available_actors))]
+                    if candidate not in forbidden:
+                        target_actor = candidate
+                        break
+                if target_actor is None:
+                    # Dense neighborhood: fall back to an explicit filter
+                    eligible = [a for a in available_actors if a not in forbidden]
+                    if not eligible:
+                        logger.info("No valid partner for %d-day exclusion, trying shorter window", exclusion_days)
+                        continue
+                    target_actor = eligible[rng.randrange(len(eligible))]
+
+                # Valid puzzle found - save it
+                logger.info("Found valid pair (exclusion: %dd)", exclusion_days)
+
+                self.state["puzzles"][puzzle_id] = {
+                    "start_actor": start_actor,
+                    "target_actor": target_actor,
+                    "generated_at": datetime.now().isoformat(),
+                    "exclusion_days": exclusion_days
+                }
+                self.state["recent_actors"][start_actor] = puzzle_id
+                self.state["recent_actors"][target_actor] = puzzle_id
+                self._puzzle_cache[puzzle_id] = (start_actor, target_actor)
+
+                # Cleanup old entries (keep only 25 days for safety buffer)
+                self._cleanup_old_actors(cutoffs[25])
+
+                self._dirty = True
+
+                return start_actor, target_actor
+
+            # Fallback: if no valid pair found even without exclusion, use any two
+            logger.warning("Using fallback (any pair) for %s", puzzle_id)
+            start_actor, target_actor = rng.sample(self._starting_pool, 2)
+
+            self.state["puzzles"][puzzle_id] = {
+                "start_actor": start_actor,
+                "target_actor": target_actor,
+                "generated_at": datetime.now().isoformat(),
+                "exclusion_days": 0,
+                "fallback": True
+            }
+            self.state["recent_actors"][start_actor] = puzzle_id
+            self.state["recent_actors"][target_actor] = puzzle_id
+            self._puzzle_cache[puzzle_id] = (start_actor, target_actor)
+            self._dirty = True
+
+            return start_actor, target_actor
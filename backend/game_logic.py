@@ -1,13 +1,50 @@
+import functools
 import unicodedata
+import weakref
 import networkx as nx
 from typing import Callable, List, Optional, Tuple, Dict, Any
 
 Resolver = Callable[[str], List[str]]  # returns list of node IDs or titles
 
 
+@functools.lru_cache(maxsize=65536)
 def norm(s: str) -> str:
-    """Normalize string for case-insensitive comparison."""
-    return unicodedata.normalize("NFKD", s).encode("ascii", "ignore").decode("ascii").lower().strip()
+    """
+    Normalize string for case-insensitive comparison (cached per distinct input).
+
+    The result is always pure ASCII (non-ASCII is decomposed and dropped).
+    The substring indexes rely on this: single-byte strings keep str.find
+    and `in` on CPython's memchr/fastsearch path with no UTF-8 re-walking.
+    """
+    # ASCII fast path: NFKD + encode/decode roundtrip is an identity there
+    if s.isascii():
+        return s.lower().strip()
+    if not unicodedata.is_normalized("NFKD", s):
+        s = unicodedata.normalize("NFKD", s)
+    return s.encode("ascii", "ignore").decode("ascii").lower().strip()
+
+
+# Per-graph movie_id -> title index, built lazily on first lookup.
+# Keyed weakly so a replaced graph doesn't pin its index in memory.
+_movie_title_cache: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _movie_titles_for_graph(graph) -> Dict[int, str]:
+    """Get (building once per graph) a movie_id -> title lookup from edge metadata."""
+    titles = _movie_title_cache.get(graph)
+    if titles is None:
+        titles = {
+            movie['id']: movie['title']
+            for _, _, data in graph.edges(data=True)
+            for movie in data.get('movies', [])
+        }
+        _movie_title_cache[graph] = titles
+    return titles
+
+
+def warm_movie_title_index(graph) -> None:
+    """Eagerly build the per-graph movie title index (call at startup)."""
+    _movie_titles_for_graph(graph)
 
 
 def get_movies_between_actors(graph, actor1: str, actor2: str) -> List[Dict[str, Any]]:
@@ -22,9 +59,14 @@ def get_movies_between_actors(graph, actor1: str, actor2: str) -> List[Dict[str,
     Returns:
         List of movie dicts with keys: id, title, poster_path, popularity, cast_size, release_date
     """
-    if not graph.has_edge(actor1, actor2):
+    # Single adjacency probe instead of has_edge plus a separate edge lookup
+    try:
+        edge_data = graph.adj[actor1].get(actor2)
+    except KeyError:
+        return []
+    if edge_data is None:
         return []
-    return graph.edges[actor1, actor2].get('movies', [])
+    return edge_data.get('movies', [])
 
 
 def _validate_with_comprehensive_index(
@@ -61,16 +103,24 @@ def _validate_with_comprehensive_index(
     if movie_id not in actor_movie_index.get("movies", {}):
         return None, None
 
-    # Get actor filmographies from index
-    current_actor_movies = actor_movie_index.get("actor_movies", {}).get(current_actor_tmdb_id, [])
-    candidate_actor_movies = actor_movie_index.get("actor_movies", {}).get(candidate_actor_tmdb_id, [])
-
-    # Check if both actors appear in the movie
-    current_has_movie = any(m["movie_id"] == movie_id for m in current_actor_movies)
-    candidate_has_movie = any(m["movie_id"] == movie_id for m in candidate_actor_movies)
+    # Check if both actors appear in the movie. Prefer the precomputed
+    # per-actor movie-id sets (O(1)) over scanning full filmographies.
+    actor_movie_ids = actor_movie_index.get("actor_movie_ids")
+    if actor_movie_ids is not None:
+        current_has_movie = movie_id in actor_movie_ids.get(current_actor_tmdb_id, ())
+        candidate_has_movie = movie_id in actor_movie_ids.get(candidate_actor_tmdb_id, ())
+    else:
+        current_actor_movies = actor_movie_index.get("actor_movies", {}).get(current_actor_tmdb_id, [])
+        candidate_actor_movies = actor_movie_index.get("actor_movies", {}).get(candidate_actor_tmdb_id, [])
+        current_has_movie = any(m["movie_id"] == movie_id for m in current_actor_movies)
+        candidate_has_movie = any(m["movie_id"] == movie_id for m in candidate_actor_movies)
 
     if current_has_movie and candidate_has_movie:
-        # Both actors in movie - construct movie_dict from index
+        # Both actors in movie - use the dict prebuilt at load time when
+        # present, otherwise assemble it from the raw index entry
+        movie_dicts = actor_movie_index.get("movie_dicts")
+        if movie_dicts is not None:
+            return movie_dicts[movie_id], candidate_actor
         movie_data = actor_movie_index["movies"][movie_id]
         movie_dict = {
             "id": movie_id,
@@ -111,11 +161,17 @@ def pick_movie_and_actor(
     Returns:
         Tuple of (movie_dict, actor_node) if valid, else (None, None)
     """
-    for candidate_actor in candidate_actors:
-        # Check if actors are connected
-        if not graph.has_edge(current_actor, candidate_actor):
-            continue
+    if current_actor not in graph:
+        return None, None
+
+    # Intersect candidates with the current actor's raw adjacency dict up
+    # front: loose name resolution can return dozens of candidates, but
+    # only actual neighbors can ever validate, and each probe is a plain
+    # dict lookup rather than a has_edge call.
+    adjacency = graph._adj[current_actor]
+    connected = [c for c in candidate_actors if c in adjacency]
 
+    for candidate_actor in connected:
         # NEW: Try comprehensive index first (if available)
         if actor_movie_index is not None:
             movie_dict, next_actor = _validate_with_comprehensive_index(
@@ -124,11 +180,17 @@ def pick_movie_and_actor(
             if movie_dict is not None:
                 return movie_dict, next_actor
 
-        # EXISTING: Fallback to edge metadata
-        movies = get_movies_between_actors(graph, current_actor, candidate_actor)
-        for movie in movies:
-            if movie['id'] == movie_id:
-                return movie, candidate_actor
+        # EXISTING: Fallback to edge metadata, via a per-edge id -> movie
+        # dict built on first use so dense pairs cost one hash lookup
+        # instead of a scan of their shared filmography
+        edge_data = adjacency[candidate_actor]
+        movies_by_id = edge_data.get('movies_by_id')
+        if movies_by_id is None:
+            movies_by_id = {m['id']: m for m in edge_data.get('movies', [])}
+            edge_data['movies_by_id'] = movies_by_id
+        movie = movies_by_id.get(movie_id)
+        if movie is not None:
+            return movie, candidate_actor
 
     return None, None
 
@@ -144,6 +206,17 @@ class MovieConnectionGame:
     Path tracks actors only, with movies_used tracking which movies were used.
     """
 
+    # One instance per active session; slots drop the per-instance __dict__
+    # and speed up the attribute access that dominates guess()
+    __slots__ = (
+        "graph", "start", "target", "current", "path", "movies_used",
+        "completed", "max_incorrect", "incorrect_guesses", "total_guesses",
+        "gave_up", "resolve_actor", "resolve_movie", "actor_name_index",
+        "actor_movie_index", "shortest_distance",
+        "pending_movie_id", "pending_movie_dict", "_node_attrs",
+        "_guess_cache", "_labels",
+    )
+
     def __init__(
         self,
         graph,
@@ -153,8 +226,13 @@ class MovieConnectionGame:
         resolve_actor: Optional[Resolver] = None,
         resolve_movie: Optional[Resolver] = None,
         actor_movie_index: Optional[Dict] = None,  # NEW: Comprehensive index
+        actor_name_index: Optional[Dict[str, List[str]]] = None,  # normalized name -> node IDs
+        shortest_distance: Optional[int] = None,  # precomputed; skips the BFS below
     ):
         self.graph = graph
+        # Raw node-attribute dict (NetworkX internal); skips the AtlasView
+        # wrapper that graph.nodes[x] constructs on every access
+        self._node_attrs = graph._node
         self.start = start_actor_node
         self.target = target_actor_node
         self.current = start_actor_node
@@ -174,19 +252,45 @@ class MovieConnectionGame:
         self.resolve_actor = resolve_actor or (lambda name: [])
         self.resolve_movie = resolve_movie or (lambda title: [])
 
+        # Optional exact-match shortcut: normalized actor name -> node IDs.
+        # Hits skip the resolver's loose catalog matching entirely.
+        self.actor_name_index = actor_name_index
+
         # NEW: Store comprehensive index for validation
         self.actor_movie_index = actor_movie_index
 
-        # Pre-compute shortest path distance
-        try:
-            self.shortest_distance = nx.shortest_path_length(graph, start_actor_node, target_actor_node)
-        except nx.NetworkXNoPath:
-            self.shortest_distance = None
+        # Pre-compute shortest path distance (callers with a faster
+        # search, e.g. the CSR adjacency, pass the result in)
+        if shortest_distance is not None:
+            self.shortest_distance = shortest_distance
+        else:
+            try:
+                self.shortest_distance = nx.shortest_path_length(graph, start_actor_node, target_actor_node)
+            except nx.NetworkXNoPath:
+                self.shortest_distance = None
 
         # NEW: Store pending movie for two-step guessing
         self.pending_movie_id = None
         self.pending_movie_dict = None
 
+        # Repeated-guess memo: (movie_id, actor, pending) -> last result.
+        # Cleared whenever the game state advances; see guess().
+        self._guess_cache = {}
+
+        # Display labels for nodes this game has touched; filled as nodes
+        # join the path so _label never hits the graph on the hot path
+        self._labels = {}
+        self._remember_label(start_actor_node)
+        self._remember_label(target_actor_node)
+
+    def _resolve_actor_candidates(self, actor_name: str) -> List[str]:
+        """Resolve an actor name to node IDs, preferring the exact-match index."""
+        if self.actor_name_index is not None:
+            hit = self.actor_name_index.get(norm(actor_name))
+            if hit:
+                return list(hit)
+        return self.resolve_actor(actor_name)
+
     def _is_movie_already_used(self, movie_id: int) -> bool:
         """Check if a movie was already used in a correct guess."""
         return any(m['id'] == movie_id for m in self.movies_used)
@@ -200,6 +304,10 @@ class MovieConnectionGame:
         Process a movie+actor guess in actor-actor graph.
         Supports progressive guessing: movie-only, then actor-only.
 
+        Repeating an identical guess while the game state hasn't advanced
+        returns the memoized result without re-validating or re-counting,
+        so UI spam and double-submits can't burn extra incorrect guesses.
+
         Args:
             movie_id: TMDb movie ID connecting actors (optional for step 1)
             actor_name: Name of actor to move to (optional for step 2)
@@ -210,6 +318,24 @@ class MovieConnectionGame:
         if self.completed:
             return False, "Game is already complete.", None
 
+        key = (movie_id, norm(actor_name) if actor_name is not None else None, self.pending_movie_id)
+        cached = self._guess_cache.get(key)
+        if cached is not None:
+            return cached
+
+        position_before = self.current
+        result = self._guess_impl(movie_id, actor_name)
+        if self.current != position_before or self.pending_movie_id != key[2]:
+            # The move advanced the game; earlier outcomes were computed
+            # against a stale position and no longer apply
+            self._guess_cache.clear()
+        else:
+            self._guess_cache[key] = result
+        return result
+
+    def _guess_impl(self, movie_id: Optional[int], actor_name: Optional[str]):
+        """Validate a guess and apply it to the game state (uncached)."""
+
         # Case 1: Movie-only guess (first step)
         if movie_id is not None and actor_name is None:
             return self._guess_movie_only(movie_id)
@@ -228,7 +354,7 @@ class MovieConnectionGame:
                 movie_title = self.actor_movie_index.get("movies", {}).get(movie_id, {}).get("title", f"Movie #{movie_id}")
                 return False, f"You've already used \"{movie_title}\". Try a different one.", None
 
-            candidate_actors = self.resolve_actor(actor_name)
+            candidate_actors = self._resolve_actor_candidates(actor_name)
             if not candidate_actors:
                 self.total_guesses += 1
                 self._inc_incorrect()
@@ -248,10 +374,8 @@ class MovieConnectionGame:
             if not movie_dict:
                 self._inc_incorrect()
                 movie_title = self._get_movie_title(movie_id)
-                actor_exists = any(
-                    self.graph.has_edge(self.current, candidate)
-                    for candidate in non_used_candidates
-                )
+                current_adj = self.graph.adj[self.current] if self.current in self.graph else {}
+                actor_exists = any(candidate in current_adj for candidate in non_used_candidates)
                 if actor_exists:
                     return False, f"\"{movie_title}\" doesn't connect {self._label(self.current)} and {actor_name}. They might have worked together in a different movie.", None
                 else:
@@ -260,6 +384,7 @@ class MovieConnectionGame:
             poster_url = f"https://image.tmdb.org/t/p/w500{movie_dict['poster_path']}" if movie_dict.get('poster_path') else None
             self.current = next_actor_node
             self.path.append(next_actor_node)
+            self._remember_label(next_actor_node)
             self.movies_used.append(movie_dict)
 
             if self.current == self.target:
@@ -293,32 +418,40 @@ class MovieConnectionGame:
         except (IndexError, ValueError):
             return False, "Invalid actor ID format.", None
 
-        current_actor_movies = self.actor_movie_index.get("actor_movies", {}).get(current_actor_tmdb_id, [])
-        current_has_movie = any(m["movie_id"] == movie_id for m in current_actor_movies)
+        actor_movie_ids = self.actor_movie_index.get("actor_movie_ids")
+        if actor_movie_ids is not None:
+            current_has_movie = movie_id in actor_movie_ids.get(current_actor_tmdb_id, ())
+        else:
+            current_actor_movies = self.actor_movie_index.get("actor_movies", {}).get(current_actor_tmdb_id, [])
+            current_has_movie = any(m["movie_id"] == movie_id for m in current_actor_movies)
 
         if not current_has_movie:
             self._inc_incorrect()
             movie_data = self.actor_movie_index["movies"][movie_id]
             return False, f"{self._label(self.current)} didn't appear in \"{movie_data['title']}\".", None
 
-        # Valid movie! Store as pending
+        # Valid movie! Store as pending (prebuilt dict when available)
         movie_data = self.actor_movie_index["movies"][movie_id]
         self.pending_movie_id = movie_id
-        self.pending_movie_dict = {
-            "id": movie_id,
-            "title": movie_data["title"],
-            "poster_path": movie_data.get("poster_path"),
-            "popularity": movie_data.get("popularity", 0),
-            "cast_size": movie_data.get("cast_size", 0),
-            "release_date": movie_data.get("release_date", "")
-        }
+        movie_dicts = self.actor_movie_index.get("movie_dicts")
+        if movie_dicts is not None:
+            self.pending_movie_dict = movie_dicts[movie_id]
+        else:
+            self.pending_movie_dict = {
+                "id": movie_id,
+                "title": movie_data["title"],
+                "poster_path": movie_data.get("poster_path"),
+                "popularity": movie_data.get("popularity", 0),
+                "cast_size": movie_data.get("cast_size", 0),
+                "release_date": movie_data.get("release_date", "")
+            }
 
         poster_url = f"https://image.tmdb.org/t/p/w500{movie_data['poster_path']}" if movie_data.get('poster_path') else None
         return True, f"✅ Valid movie: \"{movie_data['title']}\". Now guess an actor.", poster_url
 
     def _guess_actor_with_pending_movie(self, actor_name: str):
         """Validate actor guess using pending movie (second step)."""
-        candidate_actors = self.resolve_actor(actor_name)
+        candidate_actors = self._resolve_actor_candidates(actor_name)
         if not candidate_actors:
             self.total_guesses += 1
             self._inc_incorrect()
@@ -344,6 +477,7 @@ class MovieConnectionGame:
         poster_url = f"https://image.tmdb.org/t/p/w500{movie_dict['poster_path']}" if movie_dict.get('poster_path') else None
         self.current = next_actor_node
         self.path.append(next_actor_node)
+        self._remember_label(next_actor_node)
         self.movies_used.append(movie_dict)
 
         # Clear pending movie
@@ -357,6 +491,22 @@ class MovieConnectionGame:
 
         return True, f"✅ Valid move to {self._label(self.current)}.", poster_url
 
+    def swap_actors(self):
+        """
+        Swap start and target actors and reset the position to the new start.
+
+        Clears the pending movie and the repeated-guess memo: cached
+        outcomes were computed against the old position and would be
+        replayed verbatim after the reset otherwise. Callers are expected
+        to enforce their own preconditions (e.g. no moves made yet).
+        """
+        self.start, self.target = self.target, self.start
+        self.current = self.start
+        self.path = [self.start]
+        self.pending_movie_id = None
+        self.pending_movie_dict = None
+        self._guess_cache.clear()
+
     def give_up(self):
         """
         Give up on the game. Counts as a loss.
@@ -379,7 +529,8 @@ class MovieConnectionGame:
         """
         Get movie title from ID for error messages.
 
-        Searches movies_used first, then all edges in the graph.
+        Searches movies_used first, then the comprehensive index, then the
+        per-graph movie title index built from edge metadata.
 
         Args:
             movie_id: TMDb movie ID
@@ -392,14 +543,14 @@ class MovieConnectionGame:
             if movie['id'] == movie_id:
                 return movie['title']
 
-        # Search all edges for the movie
-        for u, v, data in self.graph.edges(data=True):
-            for movie in data.get('movies', []):
-                if movie['id'] == movie_id:
-                    return movie['title']
+        # Check comprehensive index if available
+        if self.actor_movie_index:
+            movie_data = self.actor_movie_index.get("movies", {}).get(movie_id)
+            if movie_data:
+                return movie_data["title"]
 
-        # Fallback if not found
-        return f"Movie #{movie_id}"
+        # O(1) lookup in the lazily built per-graph index
+        return _movie_titles_for_graph(self.graph).get(movie_id, f"Movie #{movie_id}")
 
     def _inc_incorrect(self):
         """Increment incorrect guess counter and check if game over."""
@@ -407,11 +558,19 @@ class MovieConnectionGame:
         if self.incorrect_guesses >= self.max_incorrect:
             self.completed = True
 
+    def _remember_label(self, node: str) -> str:
+        """Resolve and cache the display label for a node."""
+        data = self._node_attrs.get(node)
+        label = data.get("name", node.split("_")[-1]) if data is not None else node.split("_")[-1]
+        self._labels[node] = label
+        return label
+
     def _label(self, node: str) -> str:
         """Get display label from node (name from node attributes or node ID)."""
-        if node in self.graph.nodes:
-            return self.graph.nodes[node].get("name", node.split("_")[-1])
-        return node.split("_")[-1]
+        label = self._labels.get(node)
+        if label is not None:
+            return label
+        return self._remember_label(node)
 
     def get_state(self):
         """
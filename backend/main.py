@@ -1,21 +1,36 @@
-import os, json, hashlib, unicodedata, random, pickle, itertools, time, logging
-from uuid import uuid4
+import os, json, hashlib, random, secrets, pickle, itertools, time, logging, functools, bisect, threading, mmap
 from typing import Dict, Optional, List, Tuple
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
 import networkx as nx
-from fastapi import FastAPI, HTTPException, Query, Request
+import numpy as np
+from dataclasses import dataclass
+from fastapi import FastAPI, HTTPException, Query, Request, Response
 from fastapi.responses import JSONResponse
+
+try:  # optional fast JSON codec; stdlib serialization is the fallback
+    import orjson
+    from fastapi.responses import ORJSONResponse
+
+    def _dump_json_bytes(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    orjson = None
+    ORJSONResponse = JSONResponse
+
+    def _dump_json_bytes(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
 from pydantic import BaseModel
 
 logger = logging.getLogger("movielinks")
 
-from game_logic import MovieConnectionGame
+from game_logic import MovieConnectionGame, norm, warm_movie_title_index
 from daily_puzzle import DailyPuzzleManager
+from csr_adjacency import CSRAdjacency
 
 is_prod = os.getenv("ENV", "dev") == "production"
 
@@ -25,6 +40,8 @@ app = FastAPI(
     version="0.1.0",
     docs_url=None if is_prod else "/docs",
     redoc_url=None if is_prod else "/redoc",
+    # orjson serialization for every dict-returning endpoint
+    default_response_class=ORJSONResponse,
 )
 
 # ---------- Security Headers ----------
@@ -49,58 +66,158 @@ app.add_middleware(
     allow_headers=["Content-Type"],
 )
 
-# ---------- Graph globals ----------
+# ---------- Graph state ----------
+@dataclass(frozen=True, slots=True)
+class GraphState:
+    """
+    Immutable bundle of everything derived from one loaded graph.
+
+    Built in full before being published, so readers never observe a
+    half-initialized mix of old and new indexes; a reload swaps a single
+    reference. One shared object also keeps the load result COW-friendly
+    for forked workers.
+    """
+    graph: object
+    graph_csr: CSRAdjacency
+    checksum: str
+    actor_movie_index: Optional[dict]
+    actor_index: list
+    movie_index: list
+    actor_by_norm: dict
+    movie_by_norm: dict
+    actor_trigrams: dict
+    actor_bigrams: dict
+    movie_trigrams: dict
+    movie_bigrams: dict
+    actor_norm_blob: "SubstringBlob"
+    movie_norm_blob: "SubstringBlob"
+    actor_norm_keys: list
+    movie_norm_keys: list
+    actor_sorted_names: list
+    movie_sorted_titles: list
+    actor_name_blob: "SubstringBlob"
+    movie_title_blob: "SubstringBlob"
+    actor_node_cards: dict
+    actor_playable_idxs: frozenset
+    starting_actors: list
+    playable_count: int
+    starting_count: int
+    actor_count: int
+    edge_count: int
+    daily_puzzle_manager: object
+
+STATE: Optional[GraphState] = None
+
+# Legacy module-level aliases, rebound from STATE on (re)load. Handlers may
+# read either; the aliases always point into the current STATE.
 GRAPH = None
+GRAPH_CSR = None  # Compact read-only adjacency for hot edge/neighbor queries
 GRAPH_READY = False
 GRAPH_CHECKSUM = ""
 GRAPH_PATH = os.getenv("CINELINKS_GRAPH_PATH", "global_actor_actor_graph.gpickle")
 ACTOR_MOVIE_INDEX = None  # NEW: Comprehensive actor-movie index for StartActorScore & full movie coverage
 ACTOR_INDEX, MOVIE_INDEX = [], []
 ACTOR_BY_NORM, MOVIE_BY_NORM = {}, {}
+# N-gram indexes over normalized names/titles for autocomplete candidate pruning
+ACTOR_TRIGRAMS, ACTOR_BIGRAMS = {}, {}
+MOVIE_TRIGRAMS, MOVIE_BIGRAMS = {}, {}
+# Concatenated-string blobs for C-level bulk substring scans
+ACTOR_NORM_BLOB, MOVIE_NORM_BLOB = None, None
+ACTOR_NORM_KEYS, MOVIE_NORM_KEYS = [], []  # Sorted keys for prefix resolution
+# Sorted (name_norm, index) pairs so autocomplete can serve the common
+# prefix query with a bisect instead of a substring scan
+ACTOR_SORTED_NAMES, MOVIE_SORTED_TITLES = [], []
+ACTOR_NAME_BLOB, MOVIE_TITLE_BLOB = None, None
+ACTOR_NODE_CARDS = {}  # Prebuilt ActorNode response dicts keyed by node ID
+# Indexes into ACTOR_INDEX of playable actors, so the autocomplete filter
+# is one frozenset membership test and filtered-out candidates never touch
+# their per-actor dicts
+ACTOR_PLAYABLE_IDXS = frozenset()
+# Memoized response bytes for 1-2 character autocomplete queries: a handful
+# of leading keystrokes dominate traffic and their results only change on
+# reload. Bounded and reset by load_graph.
+ACTOR_AC_CACHE, MOVIE_AC_CACHE = {}, {}
+AC_CACHE_MAX_NEEDLE = 2
+# Today's fully built /api/daily-pair response bytes; refreshed at date
+# rollover and reset by load_graph. body is written before puzzle_id so
+# a concurrent reader never pairs a new id with stale bytes.
+DAILY_PAIR_CACHE = {"puzzle_id": None, "body": None}
+AC_CACHE_MAX_ENTRIES = 4096
+# Memoized shortest-path lists keyed by (start, target). Daily-puzzle
+# pairs mean many games share the same endpoints, so the BFS for a pair
+# runs once per graph load rather than once per request.
+SHORTEST_PATHS_CACHE = {}
+SHORTEST_PATHS_CACHE_MAX = 10000
+MAX_SHORTEST_PATHS = 100
+# Schema version stamped into the derived-index sidecar; bump when the
+# payload layout changes so an old sidecar that still matches the
+# deployed graph's checksum is treated as stale instead of crashing the
+# graph load.
+DERIVED_SIDECAR_VERSION = 2
+MOVIE_CARD_CACHE = {}  # Memoized MovieConnector response dicts keyed by movie_id
 DAILY_PUZZLE_MANAGER = None  # Daily puzzle generation with 20-day exclusion
+STARTING_ACTORS = []  # Cached starting-pool nodes (avoids per-request node scans)
+PLAYABLE_COUNT, STARTING_COUNT = 0, 0  # Cached /meta counts
+ACTOR_COUNT, EDGE_COUNT = 0, 0  # Cached graph totals for /meta
 
 # ---------- Utilities ----------
-def norm(s: str) -> str:
-    return unicodedata.normalize("NFKD", s).encode("ascii", "ignore").decode("ascii").lower().strip()
+# norm() is shared with game_logic so the API layer and the game logic
+# populate a single LRU cache instead of normalizing the same names twice
 
+@functools.lru_cache(maxsize=131072)
 def tmdb_img(path, size="w300"):
+    # (path, size) pairs repeat heavily across responses; caching means
+    # each distinct poster URL string is built (and retained) once
     return f"https://image.tmdb.org/t/p/{size}{path}" if path else None
 
-def compute_graph_fingerprint(G) -> str:
-    nodes = sorted([f"{n}|{G.nodes[n].get('type','')}" for n in G.nodes()])
-    edges = sorted([f"{u}->{v}" if u < v else f"{v}->{u}" for u, v in G.edges()])
-    blob = json.dumps({"nodes": nodes, "edges": edges}, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
-    return hashlib.sha256(blob).hexdigest()
 
 def build_indexes(G, actor_movie_index=None):
     """
-    Build actor and movie indexes for autocomplete.
+    Build actor and movie indexes plus norm lookup maps for autocomplete.
 
     For actor-actor graph:
     - Actors come from nodes (all nodes are actors)
     - Movies come from actor_movie_index (if available) for comprehensive coverage,
       otherwise from edge metadata (limited to movies connecting actors)
 
+    The name/title lookup maps are filled in the same pass that creates
+    each entry, so nodes and movies are walked once rather than iterated
+    again afterwards.
+
     Args:
         G: NetworkX graph
         actor_movie_index: Optional actor-movie index dict with 'movies' and 'actor_movies'
 
     Returns:
-        Tuple of (actors list, movies list)
+        Tuple of (actors list, movies list, actor_by_norm, movie_by_norm).
+        Movie titles map to movie IDs (not title strings) for ID-based
+        validation.
     """
     actors = []
     movies_dict = {}  # Use dict to deduplicate by movie ID
+    # Plain dicts with setdefault: appends only happen in this pass,
+    # reads happen everywhere after, and a defaultdict would silently
+    # grow on lookup misses (and pickle its factory into the sidecar)
+    actor_by_norm = {}
+    movie_by_norm = {}
 
     # Build actor index (all nodes are actors)
     for node, data in G.nodes(data=True):
         name = data.get('name', node.split('_')[-1])
+        # Prefer the normalization stamped at build time; older
+        # pickles without it fall back to normalizing here
+        name_norm = data.get('name_norm') or norm(name)
         actors.append({
             "node": node,
             "name": name,
-            "name_norm": norm(name),
+            "name_norm": name_norm,
             "image": data.get('image') or tmdb_img(data.get("profile_path"), "w185"),
-            "tmdb_id": data.get("tmdb_id")  # Add for reverse lookup
+            "tmdb_id": data.get("tmdb_id"),  # Add for reverse lookup
+            # Static node attributes cached here so autocomplete never
+            # touches the graph on the hot path
+            "playable": data.get("in_playable_graph", True),
         })
+        actor_by_norm.setdefault(name_norm, []).append(node)
 
     # Build movie index from edge metadata (always include all movies in graph)
     for u, v, edge_data in G.edges(data=True):
@@ -111,7 +228,7 @@ def build_indexes(G, actor_movie_index=None):
                 movies_dict[movie_id] = {
                     "movie_id": movie_id,
                     "title": movie['title'],
-                    "title_norm": norm(movie['title']),
+                    "title_norm": movie.get('title_norm') or norm(movie['title']),
                     "image": tmdb_img(movie.get('poster_path'), "w185"),
                     "poster_path": movie.get('poster_path'),
                 }
@@ -123,99 +240,408 @@ def build_indexes(G, actor_movie_index=None):
                 movies_dict[movie_id] = {
                     "movie_id": movie_id,
                     "title": movie_data["title"],
-                    "title_norm": norm(movie_data["title"]),
+                    "title_norm": movie_data.get("title_norm") or norm(movie_data["title"]),
                     "image": tmdb_img(movie_data.get("poster_path"), "w185"),
                     "poster_path": movie_data.get("poster_path"),
                 }
 
     movies = list(movies_dict.values())
-    return actors, movies
-
-def build_lookup_maps(G, actor_index, movie_index):
-    """
-    Build lookup maps for autocomplete.
+    for m in movies:
+        movie_by_norm.setdefault(m["title_norm"], []).append(m["movie_id"])
+    return actors, movies, actor_by_norm, movie_by_norm
 
-    NEW: Maps movie titles to movie IDs (not title strings) for ID-based validation.
+def build_ngram_index(items, key):
     """
-    actor_by_norm = defaultdict(list)
-    movie_by_norm = defaultdict(list)
+    Build trigram and bigram inverted indexes over a normalized string field.
 
-    for a in actor_index:
-        actor_by_norm[a["name_norm"]].append(a["node"])
+    Maps each 3-char (and 2-char) substring to the sorted array of item
+    offsets containing it, so autocomplete can intersect small candidate
+    lists instead of scanning the whole index per keystroke. Posting
+    lists are int32 numpy arrays so intersections run as compiled set
+    operations rather than Python set loops.
 
-    # NEW: Map to movie IDs instead of titles for ID-based validation
-    for m in movie_index:
-        movie_by_norm[m["title_norm"]].append(m["movie_id"])
+    Args:
+        items: List of index dicts (ACTOR_INDEX / MOVIE_INDEX entries)
+        key: Dict key holding the normalized string ("name_norm" / "title_norm")
 
-    return actor_by_norm, movie_by_norm
+    Returns:
+        Tuple of (trigram dict, bigram dict)
+    """
+    trigrams = defaultdict(list)
+    bigrams = defaultdict(list)
+    for i, item in enumerate(items):
+        s = item[key]
+        for gram in {s[j:j + 3] for j in range(len(s) - 2)}:
+            trigrams[gram].append(i)
+        for gram in {s[j:j + 2] for j in range(len(s) - 1)}:
+            bigrams[gram].append(i)
+    # Offsets are appended in increasing order, so each posting list is
+    # already sorted and unique
+    trigrams = {g: np.asarray(ids, dtype=np.int32) for g, ids in trigrams.items()}
+    bigrams = {g: np.asarray(ids, dtype=np.int32) for g, ids in bigrams.items()}
+    return trigrams, bigrams
+
+def ngram_candidates(needle, trigrams, bigrams):
+    """
+    Get candidate item offsets that may contain needle as a substring.
+
+    Returns a sorted int32 array of offsets, or None when the needle is
+    too short to prune and a plain scan should be used. For needles of
+    up to 3 characters the offsets are exact (a single posting list is a
+    literal substring match); longer needles can produce false positives
+    — the grams may all be present without being contiguous — so callers
+    must confirm those with a substring check.
+    """
+    if len(needle) >= 3:
+        grams = []
+        for j in range(len(needle) - 2):
+            hits = trigrams.get(needle[j:j + 3])
+            if hits is None:
+                return ()
+            grams.append(hits)
+        # Intersect smallest-first; each step is a compiled sorted-array
+        # intersection, not a Python set loop
+        grams.sort(key=len)
+        result = grams[0]
+        for hits in grams[1:]:
+            result = np.intersect1d(result, hits, assume_unique=True)
+            if result.size == 0:
+                return result
+        return result
+    if len(needle) == 2:
+        return bigrams.get(needle, ())
+    # 1-char needles match broadly; the early-exit scan is already cheap
+    return None
 
 def load_graph():
     """Load the prebuilt graph AND actor-movie index using pickle."""
-    global GRAPH, GRAPH_READY, GRAPH_CHECKSUM, ACTOR_INDEX, MOVIE_INDEX, ACTOR_BY_NORM, MOVIE_BY_NORM, ACTOR_MOVIE_INDEX, DAILY_PUZZLE_MANAGER
+    global STATE, GRAPH, GRAPH_CSR, GRAPH_READY, GRAPH_CHECKSUM, ACTOR_INDEX, MOVIE_INDEX, ACTOR_BY_NORM, MOVIE_BY_NORM, ACTOR_MOVIE_INDEX, DAILY_PUZZLE_MANAGER, ACTOR_TRIGRAMS, ACTOR_BIGRAMS, MOVIE_TRIGRAMS, MOVIE_BIGRAMS, ACTOR_NORM_BLOB, MOVIE_NORM_BLOB, ACTOR_NORM_KEYS, MOVIE_NORM_KEYS, ACTOR_SORTED_NAMES, MOVIE_SORTED_TITLES, ACTOR_NAME_BLOB, MOVIE_TITLE_BLOB, ACTOR_NODE_CARDS, ACTOR_PLAYABLE_IDXS, STARTING_ACTORS, PLAYABLE_COUNT, STARTING_COUNT, ACTOR_COUNT, EDGE_COUNT
     if not os.path.exists(GRAPH_PATH):
         print(f"[Movie Links] Graph file not found at {GRAPH_PATH}")
         GRAPH_READY = False
         return
 
     try:
-        # Load graph
-        with open(GRAPH_PATH, "rb") as f:
-            GRAPH = pickle.load(f)
+        # Load graph. Unpickling straight from a read-only mmap avoids the
+        # buffered small-read pattern of pickle.load on a file object AND
+        # the full heap copy that f.read() would make of a
+        # multi-hundred-MB file: the unpickler consumes pages as the OS
+        # faults them in, and they can be reclaimed once the objects are
+        # materialized.
+        with open(GRAPH_PATH, "rb") as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as graph_map:
+            graph = pickle.loads(graph_map)
+            # Exact hash of the pickle bytes. This keys the derived-index
+            # sidecar: the indexes are built from node/edge *attributes*
+            # (names, images, playable flags, edge movie lists), which
+            # the structural fingerprint below deliberately ignores — an
+            # attribute-only rebuild must invalidate the sidecar.
+            graph_bytes_sha = hashlib.sha256(graph_map).hexdigest()
+            # For /meta, prefer the fingerprint the builder stamped into
+            # the graph: it describes the node/edge structure, so it
+            # stays stable across re-pickles. Older graph files without
+            # the stamp fall back to the byte hash.
+            checksum = graph.graph.get("fingerprint") or graph_bytes_sha
 
         # Load actor-movie index (NEW - for comprehensive movie coverage)
         index_path = GRAPH_PATH.replace('.gpickle', '_actor_movie_index.pickle')
         if os.path.exists(index_path):
-            with open(index_path, "rb") as f:
-                ACTOR_MOVIE_INDEX = pickle.load(f)
+            with open(index_path, "rb") as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as index_map:
+                actor_movie_index = pickle.loads(index_map)
+                # The movie index half of the sidecar is assembled from
+                # this pickle too, so its bytes join the freshness key
+                index_bytes_sha = hashlib.sha256(index_map).hexdigest()
+            # Precompute per-actor movie-id sets so filmography membership
+            # checks during guess validation are O(1) instead of a scan
+            if "actor_movie_ids" not in actor_movie_index:
+                actor_movie_index["actor_movie_ids"] = {
+                    tmdb_id: frozenset(m["movie_id"] for m in movies)
+                    for tmdb_id, movies in actor_movie_index["actor_movies"].items()
+                }
+            # Canonical per-movie response dicts, assembled once here so a
+            # validated guess hands back a shared prebuilt dict instead of
+            # re-assembling six fields per guess. Consumers treat these as
+            # read-only.
+            if "movie_dicts" not in actor_movie_index:
+                actor_movie_index["movie_dicts"] = {
+                    mid: {
+                        "id": mid,
+                        "title": md["title"],
+                        "poster_path": md.get("poster_path"),
+                        "popularity": md.get("popularity", 0),
+                        "cast_size": md.get("cast_size", 0),
+                        "release_date": md.get("release_date", ""),
+                    }
+                    for mid, md in actor_movie_index["movies"].items()
+                }
             print(f"[Movie Links] Loaded actor-movie index: {index_path}")
-            print(f"[Movie Links]   Movies: {len(ACTOR_MOVIE_INDEX['movies'])}, Actors: {len(ACTOR_MOVIE_INDEX['actor_movies'])}")
+            print(f"[Movie Links]   Movies: {len(actor_movie_index['movies'])}, Actors: {len(actor_movie_index['actor_movies'])}")
         else:
             print(f"[Movie Links] WARNING: Actor-movie index not found at {index_path}")
             print(f"[Movie Links] Movie autocomplete will have limited coverage (edge metadata only)")
-            ACTOR_MOVIE_INDEX = None
+            actor_movie_index = None
+            index_bytes_sha = ""
+
+        # Build the movie-title lookup now rather than on a player's first
+        # wrong guess (it scans every edge once)
+        warm_movie_title_index(graph)
+
+        # Derived-index sidecar: building the autocomplete indexes walks
+        # every node and edge in Python, which each worker of a
+        # multi-worker deploy would repeat at startup. The first load
+        # writes the result next to the graph; subsequent loads (and
+        # sibling workers) unpickle it instead. Keyed by the exact bytes
+        # of both source pickles — not the structural fingerprint — so
+        # attribute-only rebuilds (renames, poster refreshes, playable
+        # re-tuning) and new index files invalidate it.
+        sidecar_path = GRAPH_PATH.replace('.gpickle', '_derived_indexes.pickle')
+        sidecar_key = f"{graph_bytes_sha}:{index_bytes_sha}"
+        derived = None
+        if os.path.exists(sidecar_path):
+            try:
+                with open(sidecar_path, "rb") as f:
+                    cached = pickle.loads(f.read())
+                # Field extraction stays inside the guard: a sidecar whose
+                # schema predates this code (but matches the deployed
+                # graph) must fall back to a rebuild, not fail the load
+                if (cached.get("version") == DERIVED_SIDECAR_VERSION
+                        and cached.get("source_hash") == sidecar_key):
+                    derived = (
+                        cached["actor_index"], cached["movie_index"],
+                        cached["actor_by_norm"], cached["movie_by_norm"],
+                    )
+                else:
+                    print(f"[Movie Links] Derived-index sidecar is stale, rebuilding")
+            except Exception as e:
+                derived = None
+                print(f"[Movie Links] Ignoring unusable derived-index sidecar: {e}")
+        if derived is not None:
+            actor_index, movie_index, actor_by_norm, movie_by_norm = derived
+            print(f"[Movie Links] Loaded derived indexes from sidecar: {sidecar_path}")
+        else:
+            actor_index, movie_index, actor_by_norm, movie_by_norm = build_indexes(graph, actor_movie_index)
+            try:
+                tmp_path = sidecar_path + ".tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(pickle.dumps({
+                        "version": DERIVED_SIDECAR_VERSION,
+                        "source_hash": sidecar_key,
+                        "actor_index": actor_index,
+                        "movie_index": movie_index,
+                        "actor_by_norm": dict(actor_by_norm),
+                        "movie_by_norm": dict(movie_by_norm),
+                    }, protocol=5))
+                os.replace(tmp_path, sidecar_path)
+            except Exception as e:
+                # Read-only deploys still work; they just rebuild per start
+                print(f"[Movie Links] Could not write derived-index sidecar: {e}")
+        actor_trigrams, actor_bigrams = build_ngram_index(actor_index, "name_norm")
+        movie_trigrams, movie_bigrams = build_ngram_index(movie_index, "title_norm")
+        actor_norm_blob = SubstringBlob(actor_by_norm, list(actor_by_norm.values()))
+        movie_norm_blob = SubstringBlob(movie_by_norm, list(movie_by_norm.values()))
+        actor_norm_keys = sorted(actor_by_norm)
+        movie_norm_keys = sorted(movie_by_norm)
+        actor_sorted_names = sorted((a["name_norm"], i) for i, a in enumerate(actor_index))
+        movie_sorted_titles = sorted((m["title_norm"], i) for i, m in enumerate(movie_index))
+        actor_name_blob = SubstringBlob(a["name_norm"] for a in actor_index)
+        movie_title_blob = SubstringBlob(m["title_norm"] for m in movie_index)
+        actor_node_cards = {
+            a["node"]: {"id": a["node"], "name": a["name"], "imageUrl": a["image"]}
+            for a in actor_index
+        }
+        starting_actors = graph.graph.get("starting_pool") or [
+            n for n, d in graph.nodes(data=True) if d.get("in_starting_pool", False)
+        ]
+        actor_playable_idxs = frozenset(i for i, a in enumerate(actor_index) if a["playable"])
+        playable_count = sum(1 for _, d in graph.nodes(data=True) if d.get("in_playable_graph", False))
+
+        state = GraphState(
+            graph=graph,
+            graph_csr=CSRAdjacency(graph),
+            # The pickle bytes are already a stable serialization of the
+            # deployed graph; hashing them costs one pass at SHA speed
+            # instead of walking every node and edge
+            checksum=checksum,
+            actor_movie_index=actor_movie_index,
+            actor_index=actor_index,
+            movie_index=movie_index,
+            actor_by_norm=actor_by_norm,
+            movie_by_norm=movie_by_norm,
+            actor_trigrams=actor_trigrams,
+            actor_bigrams=actor_bigrams,
+            movie_trigrams=movie_trigrams,
+            movie_bigrams=movie_bigrams,
+            actor_norm_blob=actor_norm_blob,
+            movie_norm_blob=movie_norm_blob,
+            actor_norm_keys=actor_norm_keys,
+            movie_norm_keys=movie_norm_keys,
+            actor_sorted_names=actor_sorted_names,
+            movie_sorted_titles=movie_sorted_titles,
+            actor_name_blob=actor_name_blob,
+            movie_title_blob=movie_title_blob,
+            actor_node_cards=actor_node_cards,
+            actor_playable_idxs=actor_playable_idxs,
+            starting_actors=starting_actors,
+            playable_count=playable_count,
+            starting_count=len(starting_actors),
+            actor_count=graph.number_of_nodes(),
+            edge_count=graph.number_of_edges(),
+            daily_puzzle_manager=DailyPuzzleManager(graph, starting_pool=starting_actors),
+        )
 
+        # Publish the fully built state, then rebind the legacy aliases
+        STATE = state
+        GRAPH = state.graph
+        GRAPH_CSR = state.graph_csr
+        GRAPH_CHECKSUM = state.checksum
+        ACTOR_MOVIE_INDEX = state.actor_movie_index
+        ACTOR_INDEX, MOVIE_INDEX = state.actor_index, state.movie_index
+        ACTOR_BY_NORM, MOVIE_BY_NORM = state.actor_by_norm, state.movie_by_norm
+        ACTOR_TRIGRAMS, ACTOR_BIGRAMS = state.actor_trigrams, state.actor_bigrams
+        MOVIE_TRIGRAMS, MOVIE_BIGRAMS = state.movie_trigrams, state.movie_bigrams
+        ACTOR_NORM_BLOB, MOVIE_NORM_BLOB = state.actor_norm_blob, state.movie_norm_blob
+        ACTOR_NORM_KEYS, MOVIE_NORM_KEYS = state.actor_norm_keys, state.movie_norm_keys
+        ACTOR_SORTED_NAMES, MOVIE_SORTED_TITLES = state.actor_sorted_names, state.movie_sorted_titles
+        ACTOR_NAME_BLOB, MOVIE_TITLE_BLOB = state.actor_name_blob, state.movie_title_blob
+        ACTOR_NODE_CARDS = state.actor_node_cards
+        ACTOR_PLAYABLE_IDXS = state.actor_playable_idxs
+        STARTING_ACTORS = state.starting_actors
+        PLAYABLE_COUNT, STARTING_COUNT = state.playable_count, state.starting_count
+        ACTOR_COUNT, EDGE_COUNT = state.actor_count, state.edge_count
+        ACTOR_AC_CACHE.clear()
+        MOVIE_AC_CACHE.clear()
+        SHORTEST_PATHS_CACHE.clear()
+        MOVIE_CARD_CACHE.clear()
+        DAILY_PAIR_CACHE["puzzle_id"] = None
+        DAILY_PAIR_CACHE["body"] = None
+        if DAILY_PUZZLE_MANAGER is not None:
+            # Retire the outgoing manager: stops its flusher thread and
+            # drops the atexit reference that would pin the old graph
+            DAILY_PUZZLE_MANAGER.close()
+        DAILY_PUZZLE_MANAGER = state.daily_puzzle_manager
         GRAPH_READY = True
-        GRAPH_CHECKSUM = compute_graph_fingerprint(GRAPH)
-        ACTOR_INDEX, MOVIE_INDEX = build_indexes(GRAPH, ACTOR_MOVIE_INDEX)  # Pass index to build_indexes
-        ACTOR_BY_NORM, MOVIE_BY_NORM = build_lookup_maps(GRAPH, ACTOR_INDEX, MOVIE_INDEX)
+
         print(f"[Movie Links] Loaded graph: {GRAPH_PATH}")
         print(f"[Movie Links] Nodes={GRAPH.number_of_nodes()} | Edges={GRAPH.number_of_edges()} | Movies indexed={len(MOVIE_INDEX)}")
-
-        # Log playable and starting pool counts
-        playable_count = sum(1 for _, d in GRAPH.nodes(data=True) if d.get("in_playable_graph", False))
-        starting_count = sum(1 for _, d in GRAPH.nodes(data=True) if d.get("in_starting_pool", False))
-        print(f"[Movie Links] Playable actors: {playable_count}")
-        print(f"[Movie Links] Starting pool: {starting_count}")
-
-        # Initialize daily puzzle manager
-        DAILY_PUZZLE_MANAGER = DailyPuzzleManager(GRAPH)
+        print(f"[Movie Links] Playable actors: {PLAYABLE_COUNT}")
+        print(f"[Movie Links] Starting pool: {STARTING_COUNT}")
         print(f"[Movie Links] Daily puzzle manager initialized")
     except Exception as e:
         print(f"[Movie Links] Failed to load graph: {e}")
+        STATE = None
         GRAPH = None
+        GRAPH_CSR = None
         GRAPH_READY = False
         GRAPH_CHECKSUM = ""
         ACTOR_MOVIE_INDEX = None
+        if DAILY_PUZZLE_MANAGER is not None:
+            DAILY_PUZZLE_MANAGER.close()
         DAILY_PUZZLE_MANAGER = None
 
-def resolve_from_map_loose(key: str, mapping: dict, contains: bool = True, limit: int = 50):
-    """Return list of node IDs by normalized key; supports loose 'contains' fallback."""
+class SubstringBlob:
+    """
+    Bulk "needle in string" search over many short strings.
+
+    Joins the strings with a NUL separator into one contiguous blob so a
+    substring query becomes a few C-level str.find calls over the blob
+    instead of an interpreter-dispatched `in` test per string. Matches
+    are yielded as offsets into the original sequence, in order, each
+    string at most once. Optional per-string values can be attached for
+    direct value iteration.
+    """
+    __slots__ = ("blob", "starts", "strings", "values")
+
+    def __init__(self, strings, values=None):
+        strings = list(strings)
+        starts = []
+        pos = 0
+        for text in strings:
+            starts.append(pos)
+            pos += len(text) + 1
+        self.blob = "\0".join(strings)
+        self.starts = starts
+        self.strings = strings
+        self.values = values
+
+    def iter_matches(self, needle):
+        """Yield offsets of strings containing needle (must be NUL-free)."""
+        blob, starts = self.blob, self.starts
+        n = len(starts)
+        pos = blob.find(needle)
+        while pos != -1:
+            idx = bisect.bisect_right(starts, pos) - 1
+            yield idx
+            # Resume from the start of the next string so each string is
+            # reported once no matter how many times the needle occurs
+            if idx + 1 >= n:
+                return
+            pos = blob.find(needle, starts[idx + 1])
+
+    def iter_values(self, needle):
+        """Yield the attached value for each string containing needle."""
+        values = self.values
+        for idx in self.iter_matches(needle):
+            yield values[idx]
+
+    def iter_items(self, needle):
+        """Yield (string, value) for each string containing needle."""
+        strings, values = self.strings, self.values
+        for idx in self.iter_matches(needle):
+            yield strings[idx], values[idx]
+
+def resolve_from_map_loose(key: str, mapping: dict, contains: bool = True, limit: int = 50,
+                           blob: Optional[SubstringBlob] = None, sorted_keys: Optional[list] = None):
+    """
+    Return list of node IDs by normalized key; supports loose 'contains' fallback.
+
+    On an inexact key the fallback ranks prefix matches first (found in
+    O(log N) via bisect on the sorted key list), then infix matches from
+    the blob scan, so "tom h" resolves to Tom Hanks before actors merely
+    containing the fragment.
+    """
     k = norm(key)
     if k in mapping:
         return list(mapping[k])[:limit]
     if contains:
         out = []
-        for idx_key, nodes in mapping.items():
-            if k in idx_key:
+        if sorted_keys is not None:
+            # Prefix pass: contiguous run in the sorted key list. Index
+            # from lo directly — islice would re-walk the lo skipped
+            # entries and turn the bisect into a linear scan
+            lo = bisect.bisect_left(sorted_keys, k)
+            for pos in range(lo, len(sorted_keys)):
+                idx_key = sorted_keys[pos]
+                if not idx_key.startswith(k):
+                    break
+                out.extend(mapping[idx_key])
+                if len(out) >= limit:
+                    return out[:limit]
+        if blob is not None:
+            # Infix pass: single C-level scan over all keys; prefix hits
+            # were already emitted above
+            for idx_key, nodes in blob.iter_items(k):
+                if sorted_keys is not None and idx_key.startswith(k):
+                    continue
                 out.extend(nodes)
                 if len(out) >= limit:
                     break
-        return out[:limit]
+        elif not out:
+            for idx_key, nodes in mapping.items():
+                if k in idx_key:
+                    out.extend(nodes)
+                    if len(out) >= limit:
+                        break
+        # Order-preserving dedupe: distinct keys can map to overlapping
+        # node lists, and downstream validation shouldn't re-check a
+        # candidate twice
+        return list(dict.fromkeys(out))[:limit]
     return []
 
 def resolve_actor_nodes(name: str):
     """Resolve actor name to list of actor node IDs."""
-    return resolve_from_map_loose(name, ACTOR_BY_NORM, contains=True, limit=50)
+    return resolve_from_map_loose(name, ACTOR_BY_NORM, contains=True, limit=50,
+                                  blob=ACTOR_NORM_BLOB, sorted_keys=ACTOR_NORM_KEYS)
 
 def resolve_movie_nodes(title: str):
     """
@@ -223,7 +649,8 @@ def resolve_movie_nodes(title: str):
 
     Note: Returns titles, not node IDs (movies aren't nodes in actor-actor graph).
     """
-    return resolve_from_map_loose(title, MOVIE_BY_NORM, contains=True, limit=50)
+    return resolve_from_map_loose(title, MOVIE_BY_NORM, contains=True, limit=50,
+                                  blob=MOVIE_NORM_BLOB, sorted_keys=MOVIE_NORM_KEYS)
 
 # ---------- Models / Sessions ----------
 class GuessInput(BaseModel):
@@ -278,19 +705,76 @@ class SwapActorsResponse(BaseModel):
     targetActor: ActorNode
     path: GamePath
 
-games: Dict[str, Tuple[MovieConnectionGame, float]] = {}  # game_id -> (game, created_at)
-GAME_TTL_SECONDS = 7200  # 2 hours
-MAX_GAMES = 5000
+GAME_TTL_SECONDS = int(os.getenv("CINELINKS_GAME_TTL", "7200"))  # 2 hours
+MAX_GAMES = int(os.getenv("CINELINKS_MAX_GAMES", "5000"))
 
-def cleanup_expired_games():
-    now = time.time()
-    expired = [gid for gid, (_, ts) in games.items() if now - ts > GAME_TTL_SECONDS]
-    for gid in expired:
-        del games[gid]
+class GameSessionStore:
+    """
+    Bounded LRU store for active game sessions.
+
+    Each entry carries its game, creation time, and a per-game lock.
+    Handlers run in FastAPI's thread pool, so two concurrent POSTs on
+    the same game_id would otherwise interleave path/guess updates; the
+    per-game threading.Lock serializes them with no contention across
+    games. Lookups refresh recency, inserts evict the least recently
+    used session past MAX_GAMES and sweep expired ones, so the store
+    stays bounded instead of keeping every game forever.
+    """
+
+    def __init__(self, max_games: int, ttl_seconds: int):
+        self._entries = OrderedDict()  # game_id -> (game, created_at, lock)
+        self._lock = threading.Lock()
+        self.max_games = max_games
+        self.ttl_seconds = ttl_seconds
+
+    def put(self, game_id: str, game: MovieConnectionGame):
+        now = time.time()
+        with self._lock:
+            # Expired sessions drift to the LRU front (an expired game is
+            # no longer being touched), so popping from the front until
+            # the first live entry reclaims them in O(expired) instead of
+            # scanning the whole store on every create. Any expired entry
+            # hiding deeper is still caught by get()'s lazy check or the
+            # size cap below.
+            entries = self._entries
+            while entries:
+                gid, (_, ts, _) = next(iter(entries.items()))
+                if now - ts > self.ttl_seconds:
+                    del entries[gid]
+                else:
+                    break
+            self._entries[game_id] = (game, now, threading.Lock())
+            while len(self._entries) > self.max_games:
+                self._entries.popitem(last=False)
+
+    def get(self, game_id: str) -> Optional[Tuple[MovieConnectionGame, threading.Lock]]:
+        """Return (game, lock) and refresh recency; None if absent/expired."""
+        with self._lock:
+            entry = self._entries.get(game_id)
+            if entry is None:
+                return None
+            game, created_at, lock = entry
+            if time.time() - created_at > self.ttl_seconds:
+                del self._entries[game_id]
+                return None
+            self._entries.move_to_end(game_id)
+            return game, lock
+
+    def __len__(self):
+        return len(self._entries)
+
+games = GameSessionStore(MAX_GAMES, GAME_TTL_SECONDS)
 
 # ---------- Helpers ----------
 def build_actor_node_dict(actor_id: str) -> dict:
     """Extract actor data from graph node."""
+    # Served from the card prebuilt at load time; every path render and
+    # game response hits this per node, so the graph attribute reads and
+    # name/image formatting shouldn't repeat per request. The cards are
+    # treated as read-only by all handlers.
+    card = ACTOR_NODE_CARDS.get(actor_id)
+    if card is not None:
+        return card
     data = GRAPH.nodes[actor_id]
     return {
         "id": actor_id,
@@ -300,6 +784,13 @@ def build_actor_node_dict(actor_id: str) -> dict:
 
 def build_movie_dict(movie_id: int, movie_data: dict) -> dict:
     """Build movie connector from movie data."""
+    # Title and poster are stable per movie_id, and path responses are
+    # rebuilt in full on every guess, so the card is assembled once and
+    # memoized (treated as read-only, cleared on reload)
+    card = MOVIE_CARD_CACHE.get(movie_id)
+    if card is not None:
+        return card
+
     # Get poster_path from movie_data, or fall back to ACTOR_MOVIE_INDEX
     poster_path = movie_data.get('poster_path')
     if not poster_path and ACTOR_MOVIE_INDEX:
@@ -307,68 +798,100 @@ def build_movie_dict(movie_id: int, movie_data: dict) -> dict:
         if indexed_movie:
             poster_path = indexed_movie.get('poster_path')
 
-    return {
+    card = {
         "id": movie_id,
         "title": movie_data.get('title', 'Unknown'),
         "posterUrl": tmdb_img(poster_path, 'w500')
     }
+    MOVIE_CARD_CACHE[movie_id] = card
+    return card
+
+_EDGE_BEST_UNSET = object()
 
-def calculate_path_similarity(path1, path2, graph):
-    """Calculate Jaccard similarity between two paths (0=different, 1=identical)."""
-    # Extract movie IDs from edges (using most popular movie per edge)
-    movies1 = set()
-    for i in range(len(path1) - 1):
-        edge_data = graph.edges[path1[i], path1[i + 1]]
-        movies = edge_data.get('movies', [])
-        if movies:
-            movie = max(movies, key=lambda m: m.get('popularity', 0))
-            movies1.add(movie['id'])
-
-    movies2 = set()
-    for i in range(len(path2) - 1):
-        edge_data = graph.edges[path2[i], path2[i + 1]]
-        movies = edge_data.get('movies', [])
-        if movies:
-            movie = max(movies, key=lambda m: m.get('popularity', 0))
-            movies2.add(movie['id'])
-
-    # Extract intermediate actors (exclude start/end)
-    actors1 = set(path1[1:-1])
-    actors2 = set(path2[1:-1])
-
-    # Weighted Jaccard: movies 70%, actors 30%
-    movie_jaccard = len(movies1 & movies2) / len(movies1 | movies2) if (movies1 or movies2) else 0
-    actor_jaccard = len(actors1 & actors2) / len(actors1 | actors2) if (actors1 or actors2) else 0
-
-    return 0.7 * movie_jaccard + 0.3 * actor_jaccard
+def edge_best_movie(edge_data):
+    """
+    Most popular movie on an edge, memoized in the edge dict.
+
+    The optimal-path endpoints rank the same edges over and over — across
+    candidate paths, similarity comparisons, and repeat requests for the
+    same pair. The max() over the movie list is computed on first touch
+    and cached under '_best_movie' (None for movie-less edges), so only
+    edges that paths actually cross pay the scan, with no O(E) walk at
+    startup.
+    """
+    best = edge_data.get('_best_movie', _EDGE_BEST_UNSET)
+    if best is _EDGE_BEST_UNSET:
+        movies = edge_data.get('movies')
+        best = max(movies, key=lambda m: m.get('popularity', 0)) if movies else None
+        edge_data['_best_movie'] = best
+    return best
 
 def select_diverse_paths(all_paths, max_paths=3):
     """Greedy algorithm to select diverse paths."""
     if len(all_paths) <= max_paths:
         return all_paths
 
-    selected = []
+    # Per-path movie/actor bitmasks, extracted once up front. Each
+    # distinct movie/actor in the batch gets a bit position, so every
+    # similarity below is integer AND/OR plus bit_count — a few C-level
+    # ops on ints instead of hashing through set intersections. Python
+    # ints are arbitrary-width, so batches with >64 distinct items just
+    # widen the masks.
+    movie_bit: Dict[int, int] = {}
+    actor_bit: Dict[str, int] = {}
+    movie_masks = []
+    actor_masks = []
+    for p in all_paths:
+        mask = 0
+        for i in range(len(p) - 1):
+            movie = edge_best_movie(GRAPH.edges[p[i], p[i + 1]])
+            if movie:
+                mid = movie['id']
+                mask |= 1 << movie_bit.setdefault(mid, len(movie_bit))
+        movie_masks.append(mask)
+        mask = 0
+        for actor in p[1:-1]:
+            mask |= 1 << actor_bit.setdefault(actor, len(actor_bit))
+        actor_masks.append(mask)
+
+    def similarity(a, b):
+        """Weighted Jaccard over the precomputed bitmasks (movies 70%, actors 30%)."""
+        movie_union = (movie_masks[a] | movie_masks[b]).bit_count()
+        movie_jaccard = (movie_masks[a] & movie_masks[b]).bit_count() / movie_union if movie_union else 0
+        actor_union = (actor_masks[a] | actor_masks[b]).bit_count()
+        actor_jaccard = (actor_masks[a] & actor_masks[b]).bit_count() / actor_union if actor_union else 0
+        return 0.7 * movie_jaccard + 0.3 * actor_jaccard
 
     # Step 1: Start with most popular path
-    best_path = max(all_paths, key=lambda p: sum(
-        max((m.get('popularity', 0) for m in GRAPH.edges[p[i], p[i+1]].get('movies', [])), default=0)
-        for i in range(len(p) - 1)
-    ))
-    selected.append(best_path)
-    remaining = [p for p in all_paths if p != best_path]
-
-    # Step 2: Greedily add most diverse paths
+    def path_popularity(idx):
+        total = 0
+        p = all_paths[idx]
+        for i in range(len(p) - 1):
+            movie = edge_best_movie(GRAPH.edges[p[i], p[i + 1]])
+            if movie:
+                total += movie.get('popularity', 0)
+        return total
+
+    first = max(range(len(all_paths)), key=path_popularity)
+    selected = [first]
+    remaining = [i for i in range(len(all_paths)) if i != first]
+
+    # Step 2: Greedily add paths. Each candidate's min similarity to the
+    # selected set only changes against the newest selection, so track it
+    # incrementally instead of recomputing every pair each round —
+    # O(k·r) similarity calls rather than O(k²·r)
+    min_sim = {i: similarity(i, first) for i in remaining}
     while len(selected) < max_paths and remaining:
-        best_candidate = max(
-            remaining,
-            key=lambda c: min(
-                calculate_path_similarity(c, s, GRAPH) for s in selected
-            )
-        )
-        selected.append(best_candidate)
-        remaining.remove(best_candidate)
+        best = max(remaining, key=min_sim.__getitem__)
+        selected.append(best)
+        remaining.remove(best)
+        del min_sim[best]
+        for i in remaining:
+            sim = similarity(i, best)
+            if sim < min_sim[i]:
+                min_sim[i] = sim
 
-    return selected
+    return [all_paths[i] for i in selected]
 
 def build_path_response(game: MovieConnectionGame) -> dict:
     """Convert game state to frontend path structure."""
@@ -391,8 +914,27 @@ def build_path_response(game: MovieConnectionGame) -> dict:
         "pendingMovie": pending_movie
     }
 
+def all_shortest_paths_cached(start: str, target: str) -> list:
+    """
+    Up to MAX_SHORTEST_PATHS shortest actor paths between two nodes,
+    memoized per (start, target) for the lifetime of the loaded graph.
+
+    Raises nx.NetworkXNoPath like the underlying search.
+    """
+    key = (start, target)
+    paths = SHORTEST_PATHS_CACHE.get(key)
+    if paths is None:
+        # BFS over the CSR arrays rather than NetworkX's dict-of-dict
+        # traversal; same path set, no per-expansion dict hashing
+        paths = GRAPH_CSR.all_shortest_paths(start, target, limit=MAX_SHORTEST_PATHS)
+        if not paths:
+            raise nx.NetworkXNoPath(f"No path between {start} and {target}.")
+        if len(SHORTEST_PATHS_CACHE) < SHORTEST_PATHS_CACHE_MAX:
+            SHORTEST_PATHS_CACHE[key] = paths
+    return paths
+
 def graph_not_ready_response():
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=503,
         content={
             "error": "Graph not ready",
@@ -402,29 +944,26 @@ def graph_not_ready_response():
 
 # ---------- Routes ----------
 @app.get("/health")
-def health():
-    return {"ok": True, "ready": GRAPH_READY, "service": "Movie Links API"}
+async def health():
+    # Returning the Response directly bypasses FastAPI's jsonable_encoder
+    return ORJSONResponse({"ok": True, "ready": GRAPH_READY, "service": "Movie Links API"})
 
 @app.get("/meta")
-def meta():
+async def meta():
     if not GRAPH_READY:
         return graph_not_ready_response()
 
-    # For actor-actor graph: all nodes are actors
-    actors = GRAPH.number_of_nodes()
-    playable_actors = sum(1 for _, d in GRAPH.nodes(data=True) if d.get("in_playable_graph", False))
-    starting_pool_actors = sum(1 for _, d in GRAPH.nodes(data=True) if d.get("in_starting_pool", False))
-    movies = len(MOVIE_INDEX)  # Count unique movies from edge metadata
-
-    return {
+    # For actor-actor graph: all nodes are actors; every figure here is
+    # cached at load time so /meta never touches the graph
+    return ORJSONResponse({
         "ready": True,
-        "actors": actors,
-        "playable_actors": playable_actors,
-        "starting_pool_actors": starting_pool_actors,
-        "movies": movies,
-        "edges": GRAPH.number_of_edges(),
+        "actors": ACTOR_COUNT,
+        "playable_actors": PLAYABLE_COUNT,
+        "starting_pool_actors": STARTING_COUNT,
+        "movies": len(MOVIE_INDEX),  # Count unique movies from edge metadata
+        "edges": EDGE_COUNT,
         "checksum": GRAPH_CHECKSUM
-    }
+    })
 
 @app.get("/api/daily-pair")
 def get_daily_pair():
@@ -448,41 +987,118 @@ def get_daily_pair():
     central_tz = ZoneInfo("America/Chicago")
     puzzle_id = datetime.now(central_tz).strftime("%Y%m%d")
 
+    # Every player hits this endpoint and the answer only changes at date
+    # rollover; serve the prebuilt response bytes until then
+    if DAILY_PAIR_CACHE["puzzle_id"] == puzzle_id:
+        return Response(DAILY_PAIR_CACHE["body"], media_type="application/json")
+
     # Get or generate today's puzzle
     start_actor, target_actor = DAILY_PUZZLE_MANAGER.get_daily_puzzle(puzzle_id)
 
-    return {
+    body = _dump_json_bytes({
         "puzzleId": puzzle_id,
         "startActor": build_actor_node_dict(start_actor),
         "targetActor": build_actor_node_dict(target_actor)
-    }
-
+    })
+    DAILY_PAIR_CACHE["body"] = body
+    DAILY_PAIR_CACHE["puzzle_id"] = puzzle_id
+    return Response(body, media_type="application/json")
+
+def _finish_autocomplete(cache: dict, cache_key, q: str, results: list) -> Response:
+    """Serialize an autocomplete payload, memoizing the bytes for short queries."""
+    body = _dump_json_bytes({"query": q, "results": results})
+    if cache_key is not None and len(cache) < AC_CACHE_MAX_ENTRIES:
+        cache[cache_key] = body
+    return Response(body, media_type="application/json")
+
+# The autocomplete and metadata handlers are async: they are the
+# highest-QPS endpoints, finish in microseconds against precomputed
+# indexes, and gain nothing from a thread-pool hop. Handlers that hold
+# per-game locks or walk the graph stay sync so they keep running in
+# the thread pool instead of stalling the event loop.
 @app.get("/autocomplete/actors")
-def autocomplete_actors(q: str = Query(..., min_length=1, max_length=100), limit: int = Query(10, ge=1, le=50)):
+async def autocomplete_actors(q: str = Query(..., min_length=1, max_length=100), limit: int = Query(10, ge=1, le=50)):
     if not GRAPH_READY:
         return graph_not_ready_response()
     needle = norm(q)
+    cache_key = (q, limit) if len(q) <= AC_CACHE_MAX_NEEDLE else None
+    if cache_key is not None:
+        cached = ACTOR_AC_CACHE.get(cache_key)
+        if cached is not None:
+            return Response(cached, media_type="application/json")
     out = []
-    for item in ACTOR_INDEX:
-        if needle in item["name_norm"]:
-            # Filter to playable actors only (default True for backwards compatibility)
-            if GRAPH.nodes[item["node"]].get("in_playable_graph", True):
-                tmdb_id = GRAPH.nodes[item["node"]].get("tmdb_id")
-                out.append({"name": item["name"], "image": item["image"], "tmdb_id": tmdb_id})
+    # Prefix pass: the typical autocomplete query is the start of a name,
+    # served as a contiguous bisect run in O(log N + hits)
+    lo = bisect.bisect_left(ACTOR_SORTED_NAMES, (needle,))
+    for pos in range(lo, len(ACTOR_SORTED_NAMES)):
+        name_norm, i = ACTOR_SORTED_NAMES[pos]
+        if not name_norm.startswith(needle):
+            break
+        # Filter to playable actors only
+        if i in ACTOR_PLAYABLE_IDXS:
+            item = ACTOR_INDEX[i]
+            out.append({"name": item["name"], "image": item["image"], "tmdb_id": item["tmdb_id"]})
+            if len(out) >= limit:
+                return _finish_autocomplete(ACTOR_AC_CACHE, cache_key, q, out)
+    # Infix pass for the remainder; prefix hits were already emitted.
+    # Candidates are confirmed against the flat norms column (the blob's
+    # backing list) so only true matches touch the per-actor dicts.
+    candidates = ngram_candidates(needle, ACTOR_TRIGRAMS, ACTOR_BIGRAMS)
+    if candidates is None:
+        # Single-character query: bulk blob scan instead of a per-item loop
+        candidates = ACTOR_NAME_BLOB.iter_matches(needle)
+    name_norms = ACTOR_NAME_BLOB.strings
+    # Blob and short n-gram hits are exact; only 4+ character gram
+    # intersections can contain false positives needing confirmation
+    confirm = len(needle) > 3
+    for i in candidates:
+        name_norm = name_norms[i]
+        if (not confirm or needle in name_norm) and not name_norm.startswith(needle):
+            if i in ACTOR_PLAYABLE_IDXS:
+                item = ACTOR_INDEX[i]
+                out.append({"name": item["name"], "image": item["image"], "tmdb_id": item["tmdb_id"]})
                 if len(out) >= limit:
                     break
-    return {"query": q, "results": out}
+    return _finish_autocomplete(ACTOR_AC_CACHE, cache_key, q, out)
 
 @app.get("/autocomplete/movies")
-def autocomplete_movies(q: str = Query(..., min_length=1, max_length=100), limit: int = Query(10, ge=1, le=50)):
+async def autocomplete_movies(q: str = Query(..., min_length=1, max_length=100), limit: int = Query(10, ge=1, le=50)):
     if not GRAPH_READY:
         return graph_not_ready_response()
     needle = norm(q)
+    cache_key = (q, limit) if len(q) <= AC_CACHE_MAX_NEEDLE else None
+    if cache_key is not None:
+        cached = MOVIE_AC_CACHE.get(cache_key)
+        if cached is not None:
+            return Response(cached, media_type="application/json")
     out = []
 
-    # Search in MOVIE_INDEX (built from edge metadata)
-    for item in MOVIE_INDEX:
-        if needle in item["title_norm"]:
+    # Prefix pass over the sorted title list (see autocomplete_actors)
+    lo = bisect.bisect_left(MOVIE_SORTED_TITLES, (needle,))
+    for pos in range(lo, len(MOVIE_SORTED_TITLES)):
+        title_norm, i = MOVIE_SORTED_TITLES[pos]
+        if not title_norm.startswith(needle):
+            break
+        item = MOVIE_INDEX[i]
+        out.append({
+            "title": item["title"],
+            "image": item["image"],
+            "movie_id": item.get("movie_id")
+        })
+        if len(out) >= limit:
+            return _finish_autocomplete(MOVIE_AC_CACHE, cache_key, q, out)
+
+    # Infix pass in MOVIE_INDEX (built from edge metadata), confirmed
+    # against the flat norms column before touching the per-movie dicts
+    candidates = ngram_candidates(needle, MOVIE_TRIGRAMS, MOVIE_BIGRAMS)
+    if candidates is None:
+        candidates = MOVIE_TITLE_BLOB.iter_matches(needle)
+    title_norms = MOVIE_TITLE_BLOB.strings
+    confirm = len(needle) > 3
+    for i in candidates:
+        title_norm = title_norms[i]
+        if (not confirm or needle in title_norm) and not title_norm.startswith(needle):
+            item = MOVIE_INDEX[i]
             out.append({
                 "title": item["title"],
                 "image": item["image"],
@@ -491,7 +1107,7 @@ def autocomplete_movies(q: str = Query(..., min_length=1, max_length=100), limit
             if len(out) >= limit:
                 break
 
-    return {"query": q, "results": out}
+    return _finish_autocomplete(MOVIE_AC_CACHE, cache_key, q, out)
 
 # ---------- New PRD-Compliant API Endpoints ----------
 @app.post("/api/game")
@@ -503,16 +1119,16 @@ def create_game(request: CreateGameRequest = CreateGameRequest()):
     # Use provided actors if given, otherwise select random pair
     if request.startActorId and request.targetActorId:
         # Validate provided actors exist in graph
-        if request.startActorId not in GRAPH.nodes():
+        if request.startActorId not in GRAPH:
             raise HTTPException(status_code=400, detail=f"Start actor not found: {request.startActorId}")
-        if request.targetActorId not in GRAPH.nodes():
+        if request.targetActorId not in GRAPH:
             raise HTTPException(status_code=400, detail=f"Target actor not found: {request.targetActorId}")
 
         start = request.startActorId
         target = request.targetActorId
     else:
         # Select from starting pool (high-quality, well-known actors only)
-        starting_actors = [n for n in GRAPH.nodes() if GRAPH.nodes[n].get('in_starting_pool', False)]
+        starting_actors = STARTING_ACTORS
 
         if len(starting_actors) < 2:
             raise HTTPException(status_code=500, detail="Not enough starting actors")
@@ -520,21 +1136,25 @@ def create_game(request: CreateGameRequest = CreateGameRequest()):
         # Try to find two actors that aren't directly connected
         for _ in range(100):
             start, target = random.sample(starting_actors, 2)
-            if not GRAPH.has_edge(start, target):
+            if not GRAPH_CSR.has_edge(start, target):
                 break
         else:
             # Fallback: use any two actors if all are connected
             start, target = random.sample(starting_actors, 2)
 
-    cleanup_expired_games()
-
-    game_id = str(uuid4())
-    games[game_id] = (MovieConnectionGame(
+    # 128 bits from the CSPRNG, like uuid4, but skips UUID object
+    # construction and hyphen formatting; stays unguessable so players
+    # can't enumerate each other's games
+    game_id = secrets.token_hex(16)
+    games.put(game_id, MovieConnectionGame(
         GRAPH, start, target,
         resolve_actor=resolve_actor_nodes,
         resolve_movie=resolve_movie_nodes,
         actor_movie_index=ACTOR_MOVIE_INDEX,
-    ), time.time())
+        actor_name_index=ACTOR_BY_NORM,
+        # BFS over the CSR arrays instead of NetworkX dict traversal
+        shortest_distance=GRAPH_CSR.shortest_path_length(start, target),
+    ))
 
     return {
         "gameId": game_id,
@@ -556,12 +1176,13 @@ def submit_guess(game_id: str, input: NewGuessInput):
     entry = games.get(game_id)
     if not entry:
         raise HTTPException(status_code=404, detail="Game not found")
-    game = entry[0]
+    game, lock = entry
 
-    # Validate guess using existing logic
-    success, message, poster_url = game.guess(input.movieId, input.actorName)
-
-    path_response = build_path_response(game)
+    # Serialize concurrent guesses on the same game; the path snapshot is
+    # taken under the same lock so it matches the guess outcome
+    with lock:
+        success, message, poster_url = game.guess(input.movieId, input.actorName)
+        path_response = build_path_response(game)
 
     return {
         "success": success,
@@ -584,19 +1205,19 @@ def swap_actors(game_id: str):
     entry = games.get(game_id)
     if not entry:
         raise HTTPException(status_code=404, detail="Game not found")
-    game = entry[0]
-
-    # Only allow swap if no moves have been made
-    if len(game.movies_used) > 0:
-        raise HTTPException(
-            status_code=400,
-            detail="Cannot swap actors after making a move"
-        )
+    game, lock = entry
+
+    with lock:
+        # Only allow swap if no moves have been made
+        if len(game.movies_used) > 0:
+            raise HTTPException(
+                status_code=400,
+                detail="Cannot swap actors after making a move"
+            )
 
-    # Swap the actors
-    game.start, game.target = game.target, game.start
-    game.current = game.start
-    game.path = [game.start]
+        # Swap the actors (also resets the pending movie and guess memo,
+        # which were keyed against the old position)
+        game.swap_actors()
 
     return {
         "success": True,
@@ -619,9 +1240,10 @@ def give_up_game(game_id: str):
     entry = games.get(game_id)
     if not entry:
         raise HTTPException(status_code=404, detail="Game not found")
-    game = entry[0]
+    game, lock = entry
 
-    success, message = game.give_up()
+    with lock:
+        success, message = game.give_up()
 
     if not success:
         raise HTTPException(status_code=400, detail=message)
@@ -653,9 +1275,9 @@ def get_optimal_path(game_id: str):
         raise HTTPException(status_code=404, detail="Game not found")
     game = entry[0]
 
-    # Compute ALL shortest paths
+    # Compute shortest paths (memoized per actor pair)
     try:
-        all_shortest_paths = list(nx.all_shortest_paths(GRAPH, game.start, game.target))
+        all_shortest_paths = all_shortest_paths_cached(game.start, game.target)
     except nx.NetworkXNoPath:
         raise HTTPException(status_code=500, detail="No path exists")
 
@@ -669,11 +1291,9 @@ def get_optimal_path(game_id: str):
         for path in all_shortest_paths:
             total_popularity = 0
             for i in range(len(path) - 1):
-                edge_data = GRAPH.edges[path[i], path[i + 1]]
-                movies = edge_data.get('movies', [])
-                if movies:
-                    max_movie_popularity = max(m.get('popularity', 0) for m in movies)
-                    total_popularity += max_movie_popularity
+                movie = edge_best_movie(GRAPH.edges[path[i], path[i + 1]])
+                if movie:
+                    total_popularity += movie.get('popularity', 0)
 
             if total_popularity > best_popularity:
                 best_popularity = total_popularity
@@ -687,12 +1307,9 @@ def get_optimal_path(game_id: str):
         current_actor = actor_path[i]
         next_actor = actor_path[i + 1]
 
-        edge_data = GRAPH.edges[current_actor, next_actor]
-        movies = edge_data.get('movies', [])
-
         # Pick most popular movie
-        if movies:
-            movie = max(movies, key=lambda m: m.get('popularity', 0))
+        movie = edge_best_movie(GRAPH.edges[current_actor, next_actor])
+        if movie:
             segments.append({
                 "movie": build_movie_dict(movie['id'], movie),
                 "actor": build_actor_node_dict(next_actor)
@@ -715,10 +1332,9 @@ def get_optimal_paths(game_id: str, max_paths: int = 3):
         raise HTTPException(status_code=404, detail="Game not found")
     game = entry[0]
 
-    # Get all shortest paths (limit to 100 for performance)
+    # Get shortest paths (capped at 100 for performance, memoized per pair)
     try:
-        all_paths_iter = nx.all_shortest_paths(GRAPH, game.start, game.target)
-        all_paths = list(itertools.islice(all_paths_iter, 100))
+        all_paths = all_shortest_paths_cached(game.start, game.target)
     except nx.NetworkXNoPath:
         raise HTTPException(status_code=500, detail="No path exists")
 
@@ -732,12 +1348,9 @@ def get_optimal_paths(game_id: str, max_paths: int = 3):
         for i in range(len(actor_path) - 1):
             current_actor = actor_path[i]
             next_actor = actor_path[i + 1]
-            edge_data = GRAPH.edges[current_actor, next_actor]
-            movies = edge_data.get('movies', [])
-
-            if movies:
-                # Pick most popular movie
-                movie = max(movies, key=lambda m: m.get('popularity', 0))
+            # Pick most popular movie
+            movie = edge_best_movie(GRAPH.edges[current_actor, next_actor])
+            if movie:
                 segments.append({
                     "movie": build_movie_dict(movie['id'], movie),
                     "actor": build_actor_node_dict(next_actor)
@@ -1,11 +1,10 @@
 import sys, os, networkx as nx, hashlib, random, pickle
 
-def sha256sum(filename, blocksize=65536):
-    h = hashlib.sha256()
+def sha256sum(filename):
+    # file_digest streams from the file descriptor straight into OpenSSL
+    # with the GIL released — no per-chunk Python bytes objects
     with open(filename, "rb") as f:
-        for chunk in iter(lambda: f.read(blocksize), b""):
-            h.update(chunk)
-    return h.hexdigest()
+        return hashlib.file_digest(f, "sha256").hexdigest()
 
 def verify_graph(path):
     if not os.path.exists(path):
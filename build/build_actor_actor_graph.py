@@ -14,14 +14,21 @@ Per PRD: Structure over popularity, measure once play many.
 import os
 import pickle
 import time
+import hashlib
+import multiprocessing
+import unicodedata
 import argparse
 import random
 import math
 import json
-from collections import defaultdict
+import heapq
+import threading
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv
 import requests
 import networkx as nx
+import numpy as np
 from tqdm import tqdm
 
 load_dotenv()
@@ -37,6 +44,19 @@ STARTING_MIN_VOTE_COUNT = 7000       # Middle ground: moderate expansion without
 STARTING_MIN_ELIGIBLE_CREDITS = 3    # Lowered from 5 for broader coverage
 
 
+def norm(s):
+    """Normalize a name/title for case- and accent-insensitive lookup.
+
+    Stamped onto nodes and movie dicts at build time so the backend can
+    read precomputed name_norm/title_norm instead of normalizing every
+    entry again on each process start.
+    """
+    if s.isascii():
+        return s.lower().strip()
+    s = unicodedata.normalize("NFKD", s)
+    return s.encode("ascii", "ignore").decode("ascii").lower().strip()
+
+
 def get_cache_path(cache_type, min_votes=None, max_pages=None):
     """Generate cache file path based on parameters."""
     if cache_type == "movies":
@@ -135,17 +155,48 @@ def fetch_popular_movies(min_votes=100, max_pages=100, use_cache=True, refresh_c
     return movies
 
 
-def extract_cast_from_movies(movies, top_n_cast=10):
+class RateLimiter:
+    """
+    Thread-safe sliding-window rate limiter: at most max_calls acquires
+    per period seconds, shared across all fetch workers. Keeps the
+    parallel fetch just under TMDb's 40 requests / 10 s cap.
+    """
+
+    def __init__(self, max_calls, period):
+        self.max_calls = max_calls
+        self.period = period
+        self._calls = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0] >= self.period:
+                    self._calls.popleft()
+                if len(self._calls) < self.max_calls:
+                    self._calls.append(now)
+                    return
+                wait = self.period - (now - self._calls[0])
+            time.sleep(wait)
+
+
+def extract_cast_from_movies(movies, top_n_cast=10, max_workers=20):
     """
     Extract cast with billing order (cast_order) and vote_count from each movie.
 
     NEW: Captures cast_order for StartActorScore computation and vote_count
     for audience validation threshold.
     CACHE: Now caches individual movie credits and details for faster rebuilds.
+    PARALLEL: Movies are fetched by a thread pool over one pooled session;
+    a shared rate limiter holds the aggregate request rate below TMDb's
+    cap, so wall time is bound by the rate limit instead of serial
+    round-trip latency.
 
     Args:
         movies: List of movie dicts
         top_n_cast: Number of top-billed cast to extract per movie
+        max_workers: Concurrent fetch threads
 
     Returns:
         Dict mapping movie_id -> dict with cast list (including cast_order) and metadata
@@ -156,69 +207,88 @@ def extract_cast_from_movies(movies, top_n_cast=10):
     cache_hits = 0
     api_calls = 0
 
-    for i, movie in enumerate(tqdm(movies, desc="Fetching cast & details")):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    # 35 req/10s across the pool (2 requests per uncached movie), safely
+    # under TMDb's 40/10s limit; cached movies never touch the limiter
+    limiter = RateLimiter(max_calls=35, period=10.0)
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+    session.mount("https://", adapter)
+
+    def fetch_one(movie):
         movie_id = movie["id"]
 
         # Check cache for credits and details
         credits_cache_path = os.path.join(CACHE_DIR, f"movie_{movie_id}_credits.json")
         details_cache_path = os.path.join(CACHE_DIR, f"movie_{movie_id}_details.json")
 
-        try:
-            # Try loading from cache
-            if os.path.exists(credits_cache_path) and os.path.exists(details_cache_path):
-                with open(credits_cache_path, 'r', encoding='utf-8') as f:
-                    credits_data = json.load(f)
-                with open(details_cache_path, 'r', encoding='utf-8') as f:
-                    details_data = json.load(f)
+        # Try loading from cache
+        if os.path.exists(credits_cache_path) and os.path.exists(details_cache_path):
+            with open(credits_cache_path, 'r', encoding='utf-8') as f:
+                credits_data = json.load(f)
+            with open(details_cache_path, 'r', encoding='utf-8') as f:
+                details_data = json.load(f)
+            from_cache = True
+        else:
+            # Fetch from API
+            params = {"api_key": API_KEY}
+            limiter.acquire()
+            credits_url = f"{BASE_URL}/movie/{movie_id}/credits"
+            credits_response = session.get(credits_url, params=params, timeout=10)
+            credits_response.raise_for_status()
+            credits_data = credits_response.json()
+
+            limiter.acquire()
+            details_url = f"{BASE_URL}/movie/{movie_id}"
+            details_response = session.get(details_url, params=params, timeout=10)
+            details_response.raise_for_status()
+            details_data = details_response.json()
+
+            # Save to cache
+            with open(credits_cache_path, 'w', encoding='utf-8') as f:
+                json.dump(credits_data, f, ensure_ascii=False, indent=2)
+            with open(details_cache_path, 'w', encoding='utf-8') as f:
+                json.dump(details_data, f, ensure_ascii=False, indent=2)
+            from_cache = False
+
+        cast_list = []
+        for person in credits_data.get("cast", [])[:top_n_cast]:
+            cast_list.append({
+                "id": person["id"],
+                "name": person["name"],
+                "profile_path": person.get("profile_path"),
+                "cast_order": person.get("order", 999),  # NEW: Billing position
+                "character": person.get("character", "")  # NEW: For voice acting detection
+            })
+
+        entry = None
+        if cast_list:
+            entry = {
+                "title": movie["title"],
+                "popularity": movie["popularity"],
+                "release_date": movie["release_date"],
+                "vote_count": details_data.get("vote_count", 0),  # NEW: For StartActorScore
+                "poster_path": details_data.get("poster_path"),  # Added for completeness
+                "cast": cast_list,
+                "cast_size": len(cast_list),
+                "original_language": details_data.get("original_language", "")  # NEW: For language filtering
+            }
+        return movie_id, entry, from_cache
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(fetch_one, movie): movie["id"] for movie in movies}
+        for future in tqdm(as_completed(futures), total=len(futures), desc="Fetching cast & details"):
+            try:
+                movie_id, entry, from_cache = future.result()
+            except Exception as e:
+                print(f"Error fetching data for movie {futures[future]}: {e}")
+                continue
+            if from_cache:
                 cache_hits += 1
             else:
-                # Fetch from API
-                credits_url = f"{BASE_URL}/movie/{movie_id}/credits"
-                params = {"api_key": API_KEY}
-                credits_response = requests.get(credits_url, params=params, timeout=10)
-                credits_response.raise_for_status()
-                credits_data = credits_response.json()
-
-                details_url = f"{BASE_URL}/movie/{movie_id}"
-                details_response = requests.get(details_url, params=params, timeout=10)
-                details_response.raise_for_status()
-                details_data = details_response.json()
-
-                # Save to cache
-                os.makedirs(CACHE_DIR, exist_ok=True)
-                with open(credits_cache_path, 'w', encoding='utf-8') as f:
-                    json.dump(credits_data, f, ensure_ascii=False, indent=2)
-                with open(details_cache_path, 'w', encoding='utf-8') as f:
-                    json.dump(details_data, f, ensure_ascii=False, indent=2)
-
                 api_calls += 1
-                time.sleep(0.15)  # Delay only for API calls
-
-            cast_list = []
-            for person in credits_data.get("cast", [])[:top_n_cast]:
-                cast_list.append({
-                    "id": person["id"],
-                    "name": person["name"],
-                    "profile_path": person.get("profile_path"),
-                    "cast_order": person.get("order", 999),  # NEW: Billing position
-                    "character": person.get("character", "")  # NEW: For voice acting detection
-                })
-
-            if cast_list:
-                movie_cast_data[movie_id] = {
-                    "title": movie["title"],
-                    "popularity": movie["popularity"],
-                    "release_date": movie["release_date"],
-                    "vote_count": details_data.get("vote_count", 0),  # NEW: For StartActorScore
-                    "poster_path": details_data.get("poster_path"),  # Added for completeness
-                    "cast": cast_list,
-                    "cast_size": len(cast_list),
-                    "original_language": details_data.get("original_language", "")  # NEW: For language filtering
-                }
-
-        except Exception as e:
-            print(f"Error fetching data for movie {movie_id}: {e}")
-            continue
+            if entry:
+                movie_cast_data[movie_id] = entry
 
     print(f"OK: Extracted cast with billing order from {len(movie_cast_data)} movies")
     print(f"    Cache hits: {cache_hits}, API calls: {api_calls}\n")
@@ -261,6 +331,7 @@ def build_actor_movie_index(movie_cast_data, min_votes=100, max_pages=100):
         index["movies"][movie_id] = {
             "id": movie_id,
             "title": movie_data["title"],
+            "title_norm": norm(movie_data["title"]),
             "popularity": movie_data["popularity"],
             "vote_count": movie_data.get("vote_count", 0),
             "poster_path": movie_data.get("poster_path"),
@@ -286,6 +357,13 @@ def build_actor_movie_index(movie_cast_data, min_votes=100, max_pages=100):
     # Convert defaultdict to regular dict for pickling
     index["actor_movies"] = dict(index["actor_movies"])
 
+    # Precompute per-actor movie-id sets so the backend's guess validation
+    # can test filmography membership in O(1) without rebuilding them on load
+    index["actor_movie_ids"] = {
+        actor_id: frozenset(m["movie_id"] for m in movies)
+        for actor_id, movies in index["actor_movies"].items()
+    }
+
     # Add metadata
     index["metadata"] = {
         "build_date": datetime.now().isoformat(),
@@ -435,10 +513,22 @@ def calculate_actor_language_voice_stats(actor_movies_list, min_vote_count=10000
     }
 
 
+# StartActorScore thresholds (per PRD), shared by the scalar scorer and
+# the vectorized batch ranking
+MIN_VOTE_COUNT = 3000  # Lowered to include more movies like "The Place Beyond The Pines"
+MAX_CAST_ORDER = 5
+MIN_ELIGIBLE_CREDITS = 3
+TOP_K_CREDITS = 15  # Top-K aggregation
+
+
 def compute_start_actor_score(actor_id, actor_movies_list):
     """
     Compute StartActorScore for a single actor based on exposure-weighted credits.
 
+    Scalar reference implementation of the scoring methodology;
+    rank_actors_by_start_score applies the same formula vectorized
+    across all actors at once.
+
     Implements PRD scoring methodology:
     - Eligibility: vote_count >= 10k, cast_order <= 5, min 3 qualifying credits
     - Per-credit exposure: log(1 + vote_count) * billing_weight
@@ -461,11 +551,7 @@ def compute_start_actor_score(actor_id, actor_movies_list):
         - K: int (credits used)
         - reason: str (if not eligible)
     """
-    # Thresholds (per PRD)
-    MIN_VOTE_COUNT = 3000  # Lowered to include more movies like "The Place Beyond The Pines"
-    MAX_CAST_ORDER = 5
-    MIN_ELIGIBLE_CREDITS = 3
-    K = 15  # Top-K aggregation
+    K = TOP_K_CREDITS
 
     # Filter to eligible credits
     eligible_credits = []
@@ -497,9 +583,10 @@ def compute_start_actor_score(actor_id, actor_movies_list):
             "top_k_credits": []
         }
 
-    # Sort by exposure and take top K
-    eligible_credits.sort(key=lambda c: c["exposure_score"], reverse=True)
-    top_k = eligible_credits[:K]
+    # Top K by exposure via a bounded heap — O(n log K) and no need to
+    # order the credits below the cutoff (equivalent to sorting
+    # descending and slicing, including tie order)
+    top_k = heapq.nlargest(K, eligible_credits, key=lambda c: c["exposure_score"])
 
     # Compute aggregate exposure score
     total_exposure = sum(c["exposure_score"] for c in top_k)
@@ -542,6 +629,14 @@ def rank_actors_by_start_score(actor_movie_index):
     """
     Rank all actors by StartActorScore.
 
+    Vectorized over a flat struct-of-arrays credits table: every
+    (actor, credit) row lands in numpy columns once, then eligibility,
+    exposure, per-actor top-K aggregation, and HHI are computed for all
+    actors in a handful of array passes instead of per-credit Python
+    math dispatches. Applies the same formula as
+    compute_start_actor_score; metrics dicts (with top-K credit copies)
+    are materialized only for actors that meet eligibility.
+
     Args:
         actor_movie_index: Dict with "actor_movies" mapping actor_id -> filmography
 
@@ -550,12 +645,81 @@ def rank_actors_by_start_score(actor_movie_index):
     """
     print("=== Computing StartActorScore for All Actors ===")
 
-    actor_scores = []
+    actor_movies = actor_movie_index["actor_movies"]
+    actor_ids = list(actor_movies)
+    n_actors = len(actor_ids)
+
+    # Flatten to SoA columns in one appends-only pass; all math happens
+    # vectorized below. row_credit keeps a reference per row so top-K
+    # credit dicts can be rebuilt for eligible actors at the end.
+    row_actor = []
+    row_vote = []
+    row_order = []
+    row_credit = []
+    for idx, aid in enumerate(actor_ids):
+        for credit in actor_movies[aid]:
+            row_actor.append(idx)
+            row_vote.append(credit["vote_count"])
+            row_order.append(credit["cast_order"])
+            row_credit.append(credit)
+
+    row_actor = np.asarray(row_actor, dtype=np.int32)
+    row_vote = np.asarray(row_vote, dtype=np.float64)
+    row_order = np.asarray(row_order, dtype=np.float64)
+
+    eligible = (row_vote >= MIN_VOTE_COUNT) & (row_order <= MAX_CAST_ORDER)
+    billing_weight = 1.0 / (1.0 + row_order)
+    exposure = np.log1p(row_vote) * billing_weight
+
+    elig_rows = np.nonzero(eligible)[0]
+    elig_actor = row_actor[elig_rows]
+    elig_exposure = exposure[elig_rows]
+    counts = np.bincount(elig_actor, minlength=n_actors)
+
+    # Order eligible rows by actor, then exposure descending; lexsort is
+    # stable, so filmography order breaks ties like the scalar sort
+    order = np.lexsort((-elig_exposure, elig_actor))
+    sorted_rows = elig_rows[order]
+    sorted_actor = elig_actor[order]
+    sorted_exposure = elig_exposure[order]
+
+    # Rank of each row within its actor's run; the top K rows per actor
+    # contribute to the aggregate exposure and HHI
+    starts = np.zeros(n_actors + 1, dtype=np.int64)
+    np.cumsum(counts, out=starts[1:])
+    rank_in_actor = np.arange(sorted_actor.size, dtype=np.int64) - starts[sorted_actor]
+    topk = rank_in_actor < TOP_K_CREDITS
+
+    total_exposure = np.bincount(sorted_actor[topk], weights=sorted_exposure[topk], minlength=n_actors)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        shares = sorted_exposure[topk] / total_exposure[sorted_actor[topk]]
+    hhi = np.bincount(sorted_actor[topk], weights=np.nan_to_num(shares) ** 2, minlength=n_actors)
+
+    # Normalize HHI to [0, 1] (1/K balanced .. 1.0 concentrated) and
+    # combine: exposure dominates (85%), HHI as tie-breaker (15%)
+    min_hhi = 1.0 / TOP_K_CREDITS
+    hhi_normalized = (hhi - min_hhi) / (1.0 - min_hhi)
+    final_score = (0.85 * total_exposure) + (0.15 * hhi_normalized * 100)
 
-    for actor_id, movies_list in tqdm(actor_movie_index["actor_movies"].items(), desc="Scoring actors"):
-        result = compute_start_actor_score(actor_id, movies_list)
-        if result["eligibility_met"]:
-            actor_scores.append((actor_id, result["final_score"], result))
+    actor_scores = []
+    for idx in np.nonzero(counts >= MIN_ELIGIBLE_CREDITS)[0]:
+        top_k = []
+        for r in sorted_rows[starts[idx]:min(starts[idx] + TOP_K_CREDITS, starts[idx + 1])]:
+            credit_copy = row_credit[r].copy()
+            credit_copy["billing_weight"] = float(billing_weight[r])
+            credit_copy["exposure_score"] = float(exposure[r])
+            top_k.append(credit_copy)
+        result = {
+            "eligibility_met": True,
+            "top_k_credits": top_k,
+            "exposure_score": float(total_exposure[idx]),
+            "hhi_score": float(hhi[idx]),
+            "hhi_normalized": float(hhi_normalized[idx]),
+            "final_score": float(final_score[idx]),
+            "num_eligible_credits": int(counts[idx]),
+            "K": TOP_K_CREDITS
+        }
+        actor_scores.append((actor_ids[idx], result["final_score"], result))
 
     # Sort by final_score descending
     actor_scores.sort(key=lambda x: x[1], reverse=True)
@@ -728,6 +892,10 @@ def apply_start_actor_scores_to_graph(G, actor_scores_ranked, actor_movie_index,
             G.nodes[actor_node]['start_actor_score'] = score
             starting_pool_nodes.append(actor_node)
 
+    # Record the pool at graph level so consumers can enumerate it without
+    # re-scanning every node's attributes
+    G.graph["starting_pool"] = list(starting_pool_nodes)
+
     print(f"OK: Starting pool marked: {len(starting_pool_nodes)} actors")
     if actor_scores_ranked:
         print(f"  Score range: [{actor_scores_ranked[min(top_n-1, len(actor_scores_ranked)-1)][1]:.2f}, "
@@ -754,46 +922,50 @@ def generate_audit_csv(actor_scores_ranked, actor_movie_index, output_path):
 
     print(f"=== Generating Audit Report: {output_path} ===")
 
-    with open(output_path, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        writer.writerow([
-            "rank", "actor_id", "actor_name", "final_score",
-            "exposure_score", "hhi_score", "hhi_normalized",
-            "num_eligible_credits", "top_k_count",
-            "english_percent", "voice_percent",
-            "top_movie_1", "top_movie_2", "top_movie_3"
-        ])
+    header = [
+        "rank", "actor_id", "actor_name", "final_score",
+        "exposure_score", "hhi_score", "hhi_normalized",
+        "num_eligible_credits", "top_k_count",
+        "english_percent", "voice_percent",
+        "top_movie_1", "top_movie_2", "top_movie_3"
+    ]
+
+    actor_movies = actor_movie_index["actor_movies"]
 
+    def rows():
         for rank, (actor_id, score, metrics) in enumerate(actor_scores_ranked[:100], start=1):
             # Get actor name from first movie in their filmography
             actor_name = "Unknown"
-            if actor_id in actor_movie_index["actor_movies"] and actor_movie_index["actor_movies"][actor_id]:
+            if actor_movies.get(actor_id):
                 # Try to get name from movies, but we don't have it stored
                 # We'll need to look it up from the graph or store it
                 actor_name = f"Actor_{actor_id}"  # Placeholder
 
             top_movies = metrics["top_k_credits"][:3]
+            titles = [m["title"] for m in top_movies] + [""] * (3 - len(top_movies))
 
-            # Extract language/voice stats (available if passed through filter)
-            english_pct = metrics.get("english_percent", 0.0)
-            voice_pct = metrics.get("voice_percent", 0.0)
-
-            writer.writerow([
+            yield (
                 rank,
                 actor_id,
                 actor_name,
-                f"{score:.4f}",
-                f"{metrics['exposure_score']:.4f}",
-                f"{metrics['hhi_score']:.4f}",
-                f"{metrics['hhi_normalized']:.4f}",
+                round(score, 4),
+                round(metrics["exposure_score"], 4),
+                round(metrics["hhi_score"], 4),
+                round(metrics["hhi_normalized"], 4),
                 metrics["num_eligible_credits"],
                 metrics["K"],
-                f"{english_pct:.1f}",
-                f"{voice_pct:.1f}",
-                top_movies[0]["title"] if len(top_movies) > 0 else "",
-                top_movies[1]["title"] if len(top_movies) > 1 else "",
-                top_movies[2]["title"] if len(top_movies) > 2 else ""
-            ])
+                # Language/voice stats (available if passed through filter)
+                round(metrics.get("english_percent", 0.0), 1),
+                round(metrics.get("voice_percent", 0.0), 1),
+                *titles
+            )
+
+    # Large write buffer so the writer streams row tuples straight into
+    # a handful of flushes instead of one small write per row
+    with open(output_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows())
 
     print(f"OK: Audit CSV generated with {min(100, len(actor_scores_ranked))} actors\n")
 
@@ -812,7 +984,7 @@ def persist_actor_movie_index(index, output_path):
     print(f"=== Saving Actor-Movie Index to {output_path} ===")
 
     with open(output_path, 'wb') as f:
-        pickle.dump(index, f, protocol=4)
+        pickle.dump(index, f, protocol=5)
 
     file_size = os.path.getsize(output_path) / (1024 * 1024)
     print(f"OK: Actor-movie index saved ({file_size:.2f} MB)\n")
@@ -850,51 +1022,60 @@ def build_full_actor_graph(movie_cast_data):
     # Track actor info
     actor_info = {}
 
-    # Track edges and their movie lists
-    edge_movies = defaultdict(list)
+    # One canonical "actor_{id}" string per actor, shared by every node
+    # and edge reference: the hot pair loop never re-formats ids, repeat
+    # dict lookups hit the cached hash, and pickle stores each node
+    # string once (memoized by object identity) instead of per edge.
+    node_id_of = {}
+
+    # Track edges and their movies. Only movie ids are accumulated per
+    # edge — the metadata dict for a movie is identical on every edge
+    # that shares it, and most accumulated entries are discarded by the
+    # per-edge top-K cut anyway, so full dicts are materialized for the
+    # survivors only (from movie_cast_data) when edges are added.
+    edge_movie_ids = defaultdict(list)
     edge_weights = defaultdict(float)
 
     # Process each movie
     for movie_id, movie_data in tqdm(movie_cast_data.items(), desc="Processing movies"):
         cast = movie_data["cast"]
 
-        # Store actor info
+        # Store actor info and resolve each cast member to its canonical
+        # node-id string (formatted once per actor, ever)
+        cast_node_ids = []
         for actor in cast:
-            actor_id = f"actor_{actor['id']}"
-            if actor_id not in actor_info:
+            tmdb_id = actor["id"]
+            actor_id = node_id_of.get(tmdb_id)
+            if actor_id is None:
+                actor_id = node_id_of[tmdb_id] = f"actor_{tmdb_id}"
                 actor_info[actor_id] = {
                     "name": actor["name"],
-                    "tmdb_id": actor["id"],
+                    "tmdb_id": tmdb_id,
                     "profile_path": actor["profile_path"]
                 }
+            cast_node_ids.append(actor_id)
+
+        # The movie's weight contribution is the same for every cast
+        # pair, so compute it once instead of once per pair (O(C²) calls)
+        weight = calculate_edge_weight(
+            movie_data["popularity"],
+            movie_data["cast_size"]
+        )
 
         # Create edges between all cast pairs (co-stars)
-        for i in range(len(cast)):
-            for j in range(i + 1, len(cast)):
-                actor1_id = f"actor_{cast[i]['id']}"
-                actor2_id = f"actor_{cast[j]['id']}"
+        for i in range(len(cast_node_ids)):
+            actor1_id = cast_node_ids[i]
+            for j in range(i + 1, len(cast_node_ids)):
+                actor2_id = cast_node_ids[j]
 
                 # Create edge key (sorted for undirected graph)
-                edge = tuple(sorted([actor1_id, actor2_id]))
-
-                # Calculate weight for this movie
-                weight = calculate_edge_weight(
-                    movie_data["popularity"],
-                    movie_data["cast_size"]
-                )
+                edge = (actor1_id, actor2_id) if actor1_id <= actor2_id else (actor2_id, actor1_id)
 
                 # Accumulate weight
                 edge_weights[edge] += weight
 
-                # Add movie to edge metadata
-                edge_movies[edge].append({
-                    "id": movie_id,
-                    "title": movie_data["title"],
-                    "poster_path": movie_data.get("poster_path"),
-                    "popularity": movie_data["popularity"],
-                    "cast_size": movie_data["cast_size"],
-                    "release_date": movie_data["release_date"]
-                })
+                # Record the movie for edge metadata
+                edge_movie_ids[edge].append(movie_id)
 
     # Add nodes
     print("Adding actor nodes...")
@@ -903,6 +1084,7 @@ def build_full_actor_graph(movie_cast_data):
             actor_id,
             type="actor",
             name=info["name"],
+            name_norm=norm(info["name"]),
             tmdb_id=info["tmdb_id"],
             profile_path=info["profile_path"],
             image=f"https://image.tmdb.org/t/p/w185{info['profile_path']}" if info["profile_path"] else None
@@ -910,13 +1092,36 @@ def build_full_actor_graph(movie_cast_data):
 
     # Add edges
     print("Adding weighted edges...")
+    # Limit to top 100 most popular shared movies (increased for better coverage)
+    TOP_K_MOVIES_PER_EDGE = 100
+    # One shared metadata record per movie: edges reference the same
+    # dict instead of each building (and re-norm()ing) its own copy
+    movie_records = {}
     for edge, weight in edge_weights.items():
         actor1, actor2 = edge
-        movies = edge_movies[edge]
-
-        # Limit to top 100 most popular shared movies (increased for better coverage)
-        TOP_K_MOVIES_PER_EDGE = 100
-        movies_sorted = sorted(movies, key=lambda m: m["popularity"], reverse=True)[:TOP_K_MOVIES_PER_EDGE]
+        movie_ids = edge_movie_ids[edge]
+
+        top_ids = sorted(
+            movie_ids,
+            key=lambda mid: movie_cast_data[mid]["popularity"],
+            reverse=True
+        )[:TOP_K_MOVIES_PER_EDGE]
+
+        movies_sorted = []
+        for mid in top_ids:
+            record = movie_records.get(mid)
+            if record is None:
+                md = movie_cast_data[mid]
+                record = movie_records[mid] = {
+                    "id": mid,
+                    "title": md["title"],
+                    "title_norm": norm(md["title"]),
+                    "poster_path": md.get("poster_path"),
+                    "popularity": md["popularity"],
+                    "cast_size": md["cast_size"],
+                    "release_date": md["release_date"]
+                }
+            movies_sorted.append(record)
 
         G.add_edge(
             actor1,
@@ -1004,19 +1209,49 @@ def print_pruning_stats(stats):
     print("=" * 50 + "\n")
 
 
-def minmax_normalize(values_dict):
-    """Min-max normalization to [0, 1]."""
-    if not values_dict:
-        return {}
+def minmax_normalize(values):
+    """Min-max normalize an array to [0, 1] (all 0.5 when the range is zero)."""
+    values = np.asarray(values, dtype=np.float64)
+    if values.size == 0:
+        return values
 
-    vals = list(values_dict.values())
-    min_v = min(vals)
-    max_v = max(vals)
+    min_v = values.min()
+    max_v = values.max()
 
     if max_v == min_v:
-        return {k: 0.5 for k in values_dict.keys()}
+        return np.full_like(values, 0.5)
+
+    return (values - min_v) / (max_v - min_v)
 
-    return {k: (v - min_v) / (max_v - min_v) for k, v in values_dict.items()}
+
+# Worker-process state for the parallel betweenness pass. The graph and
+# target list are pickled once per worker (via the Pool initializer)
+# instead of once per task.
+_BW_GRAPH = None
+_BW_TARGETS = None
+
+
+def _init_betweenness_worker(G, targets):
+    global _BW_GRAPH, _BW_TARGETS
+    _BW_GRAPH = G
+    _BW_TARGETS = targets
+
+
+def _betweenness_chunk(sources):
+    """
+    Betweenness contribution of one chunk of sampled source nodes.
+
+    Brandes accumulates independently per source, and the normalization
+    constant depends only on the node count, so per-chunk normalized
+    results can simply be summed by the parent process.
+    """
+    return nx.betweenness_centrality_subset(
+        _BW_GRAPH,
+        sources=sources,
+        targets=_BW_TARGETS,
+        weight=lambda u, v, d: 1.0 / d['weight'],
+        normalized=True
+    )
 
 
 def compute_centrality_measures(G):
@@ -1035,60 +1270,75 @@ def compute_centrality_measures(G):
     """
     print("=== Computing Centrality Measures ===")
 
-    # 1. Weighted Degree Centrality
+    # 1. Weighted Degree Centrality (vectorized)
+    # One pass over the edge list fills flat index/weight columns; each
+    # endpoint's weighted degree is then two bincount accumulations
+    # instead of re-walking every adjacency dict per node
     print("Computing weighted degree centrality...")
-    weighted_degrees = {}
-    for node in G.nodes():
-        wd = sum(G[node][neighbor]['weight'] for neighbor in G.neighbors(node))
-        weighted_degrees[node] = wd
-
-    print(f"  Range: [{min(weighted_degrees.values()):.2f}, {max(weighted_degrees.values()):.2f}]")
+    nodes = list(G.nodes())
+    index_of = {node: i for i, node in enumerate(nodes)}
+    n_nodes = len(nodes)
+    n_edges = G.number_of_edges()
+    u_idx = np.empty(n_edges, dtype=np.int64)
+    v_idx = np.empty(n_edges, dtype=np.int64)
+    edge_w = np.empty(n_edges, dtype=np.float64)
+    for i, (u, v, w) in enumerate(G.edges(data='weight')):
+        u_idx[i] = index_of[u]
+        v_idx[i] = index_of[v]
+        edge_w[i] = w
+    wd = (np.bincount(u_idx, weights=edge_w, minlength=n_nodes)
+          + np.bincount(v_idx, weights=edge_w, minlength=n_nodes))
+
+    print(f"  Range: [{wd.min():.2f}, {wd.max():.2f}]")
 
     # 2. Betweenness Centrality (Approximate)
     print("Computing betweenness centrality (approximate, k=100)...")
 
-    # Create distance graph (inverse of weights for shortest path)
-    G_dist = G.copy()
-    for u, v in G_dist.edges():
-        G_dist[u][v]['distance'] = 1.0 / G_dist[u][v]['weight']
-
     # Sample k nodes for approximate betweenness
     k = min(100, G.number_of_nodes())
-    sampled_nodes = random.sample(list(G.nodes()), k)
-
-    betweenness = nx.betweenness_centrality_subset(
-        G_dist,
-        sources=sampled_nodes,
-        targets=sampled_nodes,
-        weight='distance',
-        normalized=True
-    )
+    sampled_nodes = random.sample(nodes, k)
+
+    # The k single-source Brandes passes are independent, so fan the
+    # sampled sources out across cores: each worker computes the subset
+    # betweenness for its chunk of sources (inverting weights on the fly:
+    # strong connection = short distance), and the parent sums the
+    # per-chunk dicts — see _betweenness_chunk for why that is exact.
+    n_procs = min(os.cpu_count() or 1, k)
+    if n_procs > 1:
+        chunks = [sampled_nodes[i::n_procs] for i in range(n_procs)]
+        with multiprocessing.Pool(
+            n_procs,
+            initializer=_init_betweenness_worker,
+            initargs=(G, sampled_nodes),
+        ) as pool:
+            partials = pool.map(_betweenness_chunk, chunks)
+        betweenness = partials[0]
+        for part in partials[1:]:
+            for node, val in part.items():
+                betweenness[node] += val
+    else:
+        _init_betweenness_worker(G, sampled_nodes)
+        betweenness = _betweenness_chunk(sampled_nodes)
 
-    # Fill in zero for nodes not sampled
-    for node in G.nodes():
-        if node not in betweenness:
-            betweenness[node] = 0.0
+    # Align with the node order; nodes missing from the result get zero
+    bw = np.array([betweenness.get(node, 0.0) for node in nodes], dtype=np.float64)
 
-    print(f"  Range: [{min(betweenness.values()):.4f}, {max(betweenness.values()):.4f}]")
+    print(f"  Range: [{bw.min():.4f}, {bw.max():.4f}]")
 
-    # 3. Normalize and create composite score
+    # 3. Normalize and create composite score (vector ops end to end)
     print("Creating composite scores...")
 
-    norm_wd = minmax_normalize(weighted_degrees)
-    norm_bw = minmax_normalize(betweenness)
+    composite = 0.7 * minmax_normalize(wd) + 0.3 * minmax_normalize(bw)
 
-    composite_scores = {}
-    for node in G.nodes():
-        composite_scores[node] = 0.7 * norm_wd[node] + 0.3 * norm_bw[node]
-
-    print(f"  Composite range: [{min(composite_scores.values()):.4f}, {max(composite_scores.values()):.4f}]")
+    print(f"  Composite range: [{composite.min():.4f}, {composite.max():.4f}]")
 
     # 4. Add to node attributes
     print("Adding centrality attributes to nodes...")
-    for node in G.nodes():
-        G.nodes[node]['weighted_degree'] = weighted_degrees[node]
-        G.nodes[node]['betweenness'] = betweenness[node]
-        G.nodes[node]['composite_score'] = composite_scores[node]
+    for i, node in enumerate(nodes):
+        data = G.nodes[node]
+        data['weighted_degree'] = float(wd[i])
+        data['betweenness'] = float(bw[i])
+        data['composite_score'] = float(composite[i])
 
     print("OK: Centrality computation complete\n")
 
@@ -1122,19 +1372,38 @@ def select_playable_actors(G, top_n=500):
     cutoff = top_n
     max_attempts = 5
 
+    adj = G.adj
+
     for attempt in range(1, max_attempts + 1):
         if cutoff > len(ranked_actors):
             cutoff = len(ranked_actors)
 
         selected = ranked_actors[:cutoff]
-        G_playable = G.subgraph(selected).copy()
+        selected_set = set(selected)
 
-        print(f"  Attempt {attempt}: Testing {cutoff} actors...")
-        print(f"    Nodes: {G_playable.number_of_nodes()}")
-        print(f"    Edges: {G_playable.number_of_edges()}")
+        # Count induced edges without materializing a subgraph copy:
+        # each induced edge is seen once from each endpoint
+        induced_edges = sum(
+            1 for n in selected for nbr in adj[n] if nbr in selected_set
+        ) // 2
 
-        # Check connectivity
-        if nx.is_connected(G_playable):
+        print(f"  Attempt {attempt}: Testing {cutoff} actors...")
+        print(f"    Nodes: {len(selected)}")
+        print(f"    Edges: {induced_edges}")
+
+        # Check connectivity with a BFS over the full graph's adjacency
+        # restricted to the selection — connectivity doesn't need the
+        # O(V+E) subgraph().copy() that each retry used to pay for
+        visited = {selected[0]}
+        stack = [selected[0]]
+        while stack:
+            n = stack.pop()
+            for nbr in adj[n]:
+                if nbr in selected_set and nbr not in visited:
+                    visited.add(nbr)
+                    stack.append(nbr)
+
+        if len(visited) == len(selected_set):
             print(f"  OK: Graph is connected!")
 
             # Mark nodes
@@ -1143,7 +1412,7 @@ def select_playable_actors(G, top_n=500):
 
             # Mark remaining as not in playable graph
             for node in G.nodes():
-                if node not in selected:
+                if node not in selected_set:
                     G.nodes[node]['in_playable_graph'] = False
 
             print(f"OK: Playable graph selected: {len(selected)} actors\n")
@@ -1155,10 +1424,11 @@ def select_playable_actors(G, top_n=500):
     # Fallback: use what we have even if not fully connected
     print(f"  Warning: Could not achieve full connectivity, using {cutoff} actors anyway")
     selected = ranked_actors[:cutoff]
+    selected_set = set(selected)
     for node in selected:
         G.nodes[node]['in_playable_graph'] = True
     for node in G.nodes():
-        if node not in selected:
+        if node not in selected_set:
             G.nodes[node]['in_playable_graph'] = False
 
     return G, selected
@@ -1240,6 +1510,7 @@ def enrich_playable_actor_connections(G, playable_actors, movie_cast_data):
                                 edge_movies.append({
                                     "id": movie_id,
                                     "title": movie_data["title"],
+                                    "title_norm": norm(movie_data["title"]),
                                     "popularity": movie_data["popularity"],
                                     "poster_path": movie_data.get("poster_path"),
                                     "cast_size": len(playable_cast_in_movie),
@@ -1259,6 +1530,7 @@ def enrich_playable_actor_connections(G, playable_actors, movie_cast_data):
                                 movies=[{
                                     "id": movie_id,
                                     "title": movie_data["title"],
+                                    "title_norm": norm(movie_data["title"]),
                                     "popularity": movie_data["popularity"],
                                     "poster_path": movie_data.get("poster_path"),
                                     "cast_size": len(playable_cast_in_movie),
@@ -1305,8 +1577,13 @@ def select_starting_pool(G, playable_actors, top_n=100):
     starting_pool = ranked[:min(top_n, len(ranked))]
 
     # Mark nodes
+    starting_pool_set = set(starting_pool)
     for node in G.nodes():
-        G.nodes[node]['in_starting_pool'] = (node in starting_pool)
+        G.nodes[node]['in_starting_pool'] = (node in starting_pool_set)
+
+    # Record the pool at graph level so consumers can enumerate it without
+    # re-scanning every node's attributes
+    G.graph["starting_pool"] = list(starting_pool)
 
     print(f"OK: Starting pool selected: {len(starting_pool)} actors")
     print(f"  Score range: [{G.nodes[starting_pool[-1]]['composite_score']:.4f}, "
@@ -1332,12 +1609,30 @@ def print_top_actors(G, n=20):
     print()
 
 
+def compute_graph_fingerprint(G):
+    """
+    Stable content fingerprint over the graph's nodes and edges.
+
+    Computed once here at build time and stored in G.graph so the backend
+    can expose it on /meta without walking the graph (or depending on the
+    exact pickle byte stream, which changes across protocol/version even
+    when the content doesn't).
+    """
+    h = hashlib.sha256()
+    for node in sorted(G.nodes()):
+        h.update(node.encode())
+    for u, v in sorted(tuple(sorted(e)) for e in G.edges()):
+        h.update(f"{u}|{v}".encode())
+    return h.hexdigest()
+
+
 def persist_graph(G, output_path):
     """Save graph to disk using pickle."""
     print(f"=== Saving Graph to {output_path} ===")
 
+    G.graph["fingerprint"] = compute_graph_fingerprint(G)
     with open(output_path, 'wb') as f:
-        pickle.dump(G, f, protocol=4)
+        pickle.dump(G, f, protocol=5)
 
     file_size = os.path.getsize(output_path) / (1024 * 1024)
     print(f"OK: Graph saved ({file_size:.2f} MB)\n")
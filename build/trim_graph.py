@@ -16,6 +16,7 @@ import os
 import sys
 import pickle
 import argparse
+import hashlib
 import networkx as nx
 
 
@@ -251,6 +252,16 @@ def fmt_size(path):
     return "N/A"
 
 
+def compute_graph_fingerprint(G):
+    """Stable content fingerprint over nodes and edges (matches the builder's)."""
+    h = hashlib.sha256()
+    for node in sorted(G.nodes()):
+        h.update(node.encode())
+    for u, v in sorted(tuple(sorted(e)) for e in G.edges()):
+        h.update(f"{u}|{v}".encode())
+    return h.hexdigest()
+
+
 # ---------------------------------------------------------------------------
 # Main trimming pipeline (reusable from build script)
 # ---------------------------------------------------------------------------
@@ -374,13 +385,16 @@ def trim_pipeline(graph_path, index_path, out_graph_path, out_index_path, dry_ru
 
     # Step 6: Write trimmed files
     print(f"\n--- Writing trimmed files ---")
+    # Re-stamp the content fingerprint: the copy inherited the full
+    # graph's value, which no longer describes the trimmed node/edge set
+    G_trimmed.graph["fingerprint"] = compute_graph_fingerprint(G_trimmed)
     with open(out_graph_path, "wb") as f:
-        pickle.dump(G_trimmed, f, protocol=4)
+        pickle.dump(G_trimmed, f, protocol=5)
     print(f"  Graph: {out_graph_path} ({fmt_size(out_graph_path)})")
 
     if trimmed_index:
         with open(out_index_path, "wb") as f:
-            pickle.dump(trimmed_index, f, protocol=4)
+            pickle.dump(trimmed_index, f, protocol=5)
         print(f"  Index: {out_index_path} ({fmt_size(out_index_path)})")
 
     if errors: